@@ -8,15 +8,17 @@ To use these components, you must explicitly import and use them in your code.
 They do not automatically replace the standard CrewAI components.
 
 However, automatic shimming is available through:
-1. Environment variable: FAST_CREWAI_ACCELERATION=1
-2. Import hook: import fast_crewai.shim
-3. Bootstrap script: fast-crewai-bootstrap
+1. Explicit call: fast_crewai.install()
+2. Environment variable: FAST_CREWAI_ACCELERATION=1
+3. Import hook: import fast_crewai._bootstrap
+4. Bootstrap script: fast-crewai-bootstrap
 
 The components automatically fall back to Python implementations when
 acceleration is not available, ensuring zero breaking changes.
 """
 
 import os
+import importlib
 
 # Version information
 __version__ = "0.1.0"
@@ -39,70 +41,68 @@ if os.environ.get('FAST_CREWAI_ACCELERATION') == '1':
         # Silently fail if shimming doesn't work
         pass
 
-# Import the actual components (this will handle the acceleration vs Python fallback)
-try:
-    # Try to import the accelerated extension
-    from ._core import (
-        AcceleratedMemoryStorage,
-        AcceleratedToolExecutor,
-        AcceleratedTaskExecutor,
-        AcceleratedMessage,
-        AcceleratedSQLiteWrapper,
-    )
-    
-    # Mark acceleration implementation as available
-    HAS_ACCELERATION_IMPLEMENTATION = True
-    
-except ImportError:
-    # Acceleration implementation not available, set flags to False
-    HAS_ACCELERATION_IMPLEMENTATION = False
-    
-    # Create placeholder classes to prevent ImportError
-    class AcceleratedMemoryStorage:
-        def __init__(self, *args, **kwargs):
-            raise RuntimeError("Acceleration implementation not available")
-    
-    class AcceleratedToolExecutor:
-        def __init__(self, *args, **kwargs):
-            raise RuntimeError("Acceleration implementation not available")
-            
-    class AcceleratedTaskExecutor:
-        def __init__(self, *args, **kwargs):
-            raise RuntimeError("Acceleration implementation not available")
-            
-    class AcceleratedMessage:
-        def __init__(self, *args, **kwargs):
-            raise RuntimeError("Acceleration implementation not available")
-            
-    class AcceleratedSQLiteWrapper:
-        def __init__(self, *args, **kwargs):
-            raise RuntimeError("Acceleration implementation not available")
-
-# Import public API
-from .memory import AcceleratedMemoryStorage
-from .tools import AcceleratedToolExecutor
-from .tasks import AcceleratedTaskExecutor
-from .serialization import AgentMessage, RustSerializer
-from .database import AcceleratedSQLiteWrapper
-
-# Import utility functions
-from .utils import (
-    is_acceleration_available,
-    get_acceleration_status,
-    configure_accelerated_components,
-    get_performance_improvements,
-    get_environment_info
-)
-
-# Import integration utilities
-from .integration import (
-    AcceleratedMemoryIntegration,
-    AcceleratedToolIntegration,
-    AcceleratedTaskIntegration
-)
+# Public API is imported lazily on first attribute access (PEP 562), so that
+# ``import fast_crewai`` doesn't load every component module (and CrewAI)
+# up front.
+from ._constants import HAS_ACCELERATION_IMPLEMENTATION
+
+_LAZY_ATTRIBUTES = {
+    # Components
+    "AcceleratedMemoryStorage": ".memory",
+    "AcceleratedToolExecutor": ".tools",
+    "AcceleratedTaskExecutor": ".tasks",
+    "AgentMessage": ".serialization",
+    "RustSerializer": ".serialization",
+    "AcceleratedSQLiteWrapper": ".database",
+    # Utility functions
+    "is_acceleration_available": ".utils",
+    "get_acceleration_status": ".utils",
+    "configure_accelerated_components": ".utils",
+    "get_performance_improvements": ".utils",
+    "get_environment_info": ".utils",
+    # Integration utilities
+    "AcceleratedMemoryIntegration": ".integration",
+    "AcceleratedToolIntegration": ".integration",
+    "AcceleratedTaskIntegration": ".integration",
+}
+
+
+def install(verbose: bool = False) -> bool:
+    """
+    Patch CrewAI components with their accelerated equivalents.
+
+    Call this once at application startup. Importing ``fast_crewai.shim``
+    on its own doesn't patch anything.
+
+    Args:
+        verbose: Whether to print detailed information about patching
+
+    Returns:
+        bool: True if any patch was applied or deferred, False otherwise
+        (including when CrewAI is not installed)
+    """
+    from .shim import enable_acceleration
+    return enable_acceleration(verbose=verbose)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     "HAS_ACCELERATION_IMPLEMENTATION",
+    "install",
     "AcceleratedMemoryStorage",
     "AcceleratedToolExecutor",
     "AcceleratedTaskExecutor",
@@ -117,4 +117,4 @@ __all__ = [
     "AcceleratedMemoryIntegration",
     "AcceleratedToolIntegration",
     "AcceleratedTaskIntegration",
-]
\ No newline at end of file
+]
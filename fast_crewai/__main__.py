@@ -120,7 +120,7 @@ def info_cmd(verbose=False):
             print("\nUsage Options:")
             print("  1. Explicit import: from fast_crewai import AcceleratedMemoryStorage")
             print("  2. Auto-shim: export FAST_CREWAI_ACCELERATION=1")
-            print("  3. Import hook: import fast_crewai.shim")
+            print("  3. Explicit call: fast_crewai.install()")
         else:
             print("\nRust implementation not available.")
             print("Please ensure the package was built correctly with maturin.")
@@ -0,0 +1,12 @@
+"""
+Enable acceleration as a side effect of being imported.
+
+Usage:
+    import fast_crewai._bootstrap  # Before importing CrewAI
+
+Equivalent to calling ``fast_crewai.install()`` at startup.
+"""
+
+from .shim import enable_acceleration
+
+enable_acceleration()
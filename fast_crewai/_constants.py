@@ -8,11 +8,11 @@ without creating circular imports.
 # Try to import the Rust core to determine if acceleration is available
 try:
     from ._core import (
-        AcceleratedMemoryStorage,
-        AcceleratedToolExecutor,
-        AcceleratedTaskExecutor,
+        RustMemoryStorage,
+        RustToolExecutor,
+        RustTaskExecutor,
         AgentMessage,
-        AcceleratedSQLiteWrapper,
+        RustSQLiteWrapper,
     )
     HAS_ACCELERATION_IMPLEMENTATION = True
 except ImportError:
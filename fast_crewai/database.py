@@ -14,7 +14,7 @@ from ._constants import HAS_ACCELERATION_IMPLEMENTATION
 # Try to import the Rust implementation
 if HAS_ACCELERATION_IMPLEMENTATION:
     try:
-        from ._core import AcceleratedSQLiteWrapper as _AcceleratedSQLiteWrapper
+        from ._core import RustSQLiteWrapper as _AcceleratedSQLiteWrapper
         _RUST_AVAILABLE = True
     except ImportError:
         _RUST_AVAILABLE = False
@@ -331,4 +331,153 @@ class AcceleratedSQLiteWrapper:
     
     def __repr__(self) -> str:
         """String representation of the wrapper."""
-        return f"AcceleratedSQLiteWrapper(implementation={self.implementation}, db_path={self.db_path})"
\ No newline at end of file
+        return f"AcceleratedSQLiteWrapper(implementation={self.implementation}, db_path={self.db_path})"
+
+def _default_db_path(file_name: str) -> str:
+    """Path of ``file_name`` in CrewAI's storage directory."""
+    from crewai.utilities.paths import db_storage_path
+    return os.path.join(str(db_storage_path()), file_name)
+
+
+class AcceleratedLTMSQLiteStorage(AcceleratedSQLiteWrapper):
+    """
+    Accelerated replacement for CrewAI's LTMSQLiteStorage.
+
+    Keeps long-term memories in the ``long_term_memories`` table and offers
+    the replaced class's save/load/reset interface.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        pool_size: int = 5,
+        use_rust: Optional[bool] = None
+    ):
+        super().__init__(
+            db_path or _default_db_path("long_term_memory_storage.db"), pool_size, use_rust
+        )
+
+    def save(
+        self,
+        task_description: str,
+        metadata: Dict[str, Any],
+        datetime: str,
+        score: Union[int, float]
+    ) -> None:
+        """Save a long-term memory entry."""
+        self.save_memory(task_description, metadata, datetime, score)
+
+    def load(self, task_description: str, latest_n: int = 3) -> Optional[List[Dict[str, Any]]]:
+        """Load the latest memory entries for a task, or None if there are none."""
+        return self.load_memories(task_description, latest_n)
+
+    def __repr__(self) -> str:
+        """String representation of the storage."""
+        return f"AcceleratedLTMSQLiteStorage(implementation={self.implementation}, db_path={self.db_path})"
+
+
+class AcceleratedKickoffTaskOutputsSQLiteStorage(AcceleratedSQLiteWrapper):
+    """
+    Accelerated replacement for CrewAI's KickoffTaskOutputsSQLiteStorage.
+
+    Keeps task outputs in the ``latest_kickoff_task_outputs`` table and offers
+    the replaced class's add/update/load/delete_all interface.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        pool_size: int = 5,
+        use_rust: Optional[bool] = None
+    ):
+        super().__init__(
+            db_path or _default_db_path("latest_kickoff_task_outputs.db"), pool_size, use_rust
+        )
+        self.execute_update("""
+            CREATE TABLE IF NOT EXISTS latest_kickoff_task_outputs (
+                task_id TEXT PRIMARY KEY,
+                task_key TEXT,
+                expected_output TEXT,
+                output JSON,
+                task_index INTEGER,
+                inputs JSON,
+                was_replayed BOOLEAN,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+    def add(
+        self,
+        task: Any,
+        output: Dict[str, Any],
+        task_index: int,
+        was_replayed: bool = False,
+        inputs: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Save the output of a task, replacing an earlier output of the same task.
+
+        Args:
+            task: The CrewAI task that produced the output
+            output: The task output
+            task_index: Position of the task in the crew
+            was_replayed: Whether the task was replayed
+            inputs: Inputs the crew was kicked off with
+        """
+        query = """
+            INSERT OR REPLACE INTO latest_kickoff_task_outputs
+            (task_id, task_key, expected_output, output, task_index, inputs, was_replayed)
+            VALUES (:task_id, :task_key, :expected_output, :output, :task_index, :inputs, :was_replayed)
+        """
+        params = {
+            'task_id': str(task.id),
+            'task_key': getattr(task, 'key', None),
+            'expected_output': task.expected_output,
+            'output': json.dumps(output, default=str),
+            'task_index': task_index,
+            'inputs': json.dumps(inputs or {}, default=str),
+            'was_replayed': was_replayed,
+        }
+        self.execute_update(query, params)
+
+    def update(self, task_index: int, **kwargs: Any) -> None:
+        """
+        Update columns of the output stored for ``task_index``.
+
+        Dictionary values are stored as JSON.
+        """
+        if not kwargs:
+            return
+        assignments = ", ".join(f"{column} = :{column}" for column in kwargs)
+        params = {
+            column: json.dumps(value, default=str) if isinstance(value, dict) else value
+            for column, value in kwargs.items()
+        }
+        params['task_index'] = task_index
+        self.execute_update(
+            f"UPDATE latest_kickoff_task_outputs SET {assignments} WHERE task_index = :task_index",
+            params
+        )
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Load all stored task outputs, ordered by task index."""
+        rows = self.execute_query("""
+            SELECT task_id, task_key, expected_output, output, task_index, inputs, was_replayed, timestamp
+            FROM latest_kickoff_task_outputs
+            ORDER BY task_index
+        """)
+        for row in rows:
+            row['output'] = json.loads(row['output'])
+            row['inputs'] = json.loads(row['inputs'])
+        return rows
+
+    def delete_all(self) -> None:
+        """Delete all stored task outputs."""
+        self.execute_update("DELETE FROM latest_kickoff_task_outputs")
+
+    def __repr__(self) -> str:
+        """String representation of the storage."""
+        return (
+            f"AcceleratedKickoffTaskOutputsSQLiteStorage(implementation={self.implementation}, "
+            f"db_path={self.db_path})"
+        )
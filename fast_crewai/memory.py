@@ -8,13 +8,13 @@ systems with significant performance improvements.
 import os
 import json
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from ._constants import HAS_ACCELERATION_IMPLEMENTATION
 
 # Try to import the Rust implementation
 if HAS_ACCELERATION_IMPLEMENTATION:
     try:
-        from ._core import AcceleratedMemoryStorage as _AcceleratedMemoryStorage
+        from ._core import RustMemoryStorage as _AcceleratedMemoryStorage
         _RUST_AVAILABLE = True
     except ImportError:
         _RUST_AVAILABLE = False
@@ -124,6 +124,7 @@ class AcceleratedMemoryStorage:
                 # Use Rust implementation for search (with semantic similarity)
                 serialized_results = self._storage.search(query, limit)
                 results = []
+                now = time.time()
                 for item in serialized_results:
                     try:
                         # Try to parse as JSON (from metadata save)
@@ -134,7 +135,7 @@ class AcceleratedMemoryStorage:
                         results.append({
                             'value': item,
                             'metadata': {},
-                            'timestamp': time.time()
+                            'timestamp': now
                         })
                 return results
             except Exception as e:
@@ -177,6 +178,7 @@ class AcceleratedMemoryStorage:
             try:
                 serialized_items = self._storage.get_all()
                 items = []
+                now = time.time()
                 for item in serialized_items:
                     try:
                         data = json.loads(item)
@@ -185,7 +187,7 @@ class AcceleratedMemoryStorage:
                         items.append({
                             'value': item,
                             'metadata': {},
-                            'timestamp': time.time()
+                            'timestamp': now
                         })
                 return items
             except Exception as e:
@@ -228,4 +230,71 @@ class AcceleratedMemoryStorage:
     
     def __repr__(self) -> str:
         """String representation of the storage."""
-        return f"AcceleratedMemoryStorage(implementation={self.implementation}, items={len(self)})"
\ No newline at end of file
+        return f"AcceleratedMemoryStorage(implementation={self.implementation}, items={len(self)})"
+
+
+class _CrewAIMemoryAdapter(AcceleratedMemoryStorage):
+    """
+    Accelerated replacement for a single CrewAI memory class.
+
+    Accepts the constructor arguments of the replaced class, positionally or
+    by keyword, and keeps them as attributes. Storage itself is always
+    provided by AcceleratedMemoryStorage. Like the replaced class, it raises
+    TypeError for arguments it doesn't take.
+    """
+
+    # Set on each generated subclass
+    _memory_type = "memory"
+    _init_params: Tuple[str, ...] = ()
+
+    def __init__(self, *args: Any, use_rust: Optional[bool] = None, **kwargs: Any):
+        if len(args) > len(self._init_params):
+            raise TypeError(
+                f"{type(self).__name__}() takes at most {len(self._init_params)} "
+                f"positional arguments ({len(args)} given)"
+            )
+        for name in kwargs:
+            if name not in self._init_params:
+                raise TypeError(
+                    f"{type(self).__name__}() got an unexpected keyword argument '{name}'"
+                )
+        for name in self._init_params[:len(args)]:
+            if name in kwargs:
+                raise TypeError(
+                    f"{type(self).__name__}() got multiple values for argument '{name}'"
+                )
+        super().__init__(use_rust=use_rust)
+
+        kwargs.update(zip(self._init_params, args))
+        for name in self._init_params:
+            setattr(self, name, kwargs.get(name))
+        if getattr(self, 'type', None) is None:
+            self.type = self._memory_type
+
+    def __repr__(self) -> str:
+        """String representation of the storage."""
+        return f"{type(self).__name__}(implementation={self.implementation}, items={len(self)})"
+
+
+def _memory_class(name: str, memory_type: str, init_params: Tuple[str, ...]) -> type:
+    """Create the accelerated replacement for the CrewAI class ``name``."""
+    return type(f"Accelerated{name}", (_CrewAIMemoryAdapter,), {
+        "__doc__": f"Accelerated replacement for CrewAI's {name}.",
+        "__module__": __name__,
+        "_memory_type": memory_type,
+        "_init_params": init_params,
+    })
+
+
+# One replacement per patched CrewAI class, each accepting that class's
+# constructor arguments
+AcceleratedRAGStorage = _memory_class(
+    "RAGStorage", "rag", ("type", "allow_reset", "embedder_config", "crew", "path"))
+AcceleratedShortTermMemory = _memory_class(
+    "ShortTermMemory", "short_term", ("crew", "embedder_config", "storage", "path"))
+AcceleratedMemory = _memory_class(
+    "Memory", "memory", ("storage",))
+AcceleratedLongTermMemory = _memory_class(
+    "LongTermMemory", "long_term", ("storage", "path"))
+AcceleratedEntityMemory = _memory_class(
+    "EntityMemory", "entities", ("crew", "embedder_config", "storage", "path"))
@@ -7,7 +7,7 @@ systems with zero-copy optimizations and performance improvements.
 
 import os
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from ._constants import HAS_ACCELERATION_IMPLEMENTATION
 
 # Try to import the Rust implementation
@@ -21,6 +21,26 @@ else:
     _RUST_AVAILABLE = False
 
 
+def _should_use_rust(use_rust: Optional[bool]) -> bool:
+    """
+    Decide whether to use the Rust implementation.
+    
+    An explicit ``use_rust`` wins; otherwise FAST_CREWAI_SERIALIZATION
+    ('true', 'false' or 'auto') decides. Never True when the Rust
+    implementation is not available.
+    """
+    if use_rust is None:
+        # Check environment variable
+        env_setting = os.getenv('FAST_CREWAI_SERIALIZATION', 'auto').lower()
+        if env_setting == 'true':
+            use_rust = True
+        elif env_setting == 'false':
+            use_rust = False
+        else:  # 'auto' or other values
+            use_rust = _RUST_AVAILABLE
+    return use_rust and _RUST_AVAILABLE
+
+
 class AgentMessage:
     """
     High-performance message serialization using Rust backend.
@@ -59,17 +79,7 @@ class AgentMessage:
         self.timestamp = timestamp
         
         # Check if Rust implementation should be used
-        if use_rust is None:
-            # Check environment variable
-            env_setting = os.getenv('FAST_CREWAI_SERIALIZATION', 'auto').lower()
-            if env_setting == 'true':
-                self._use_rust = True
-            elif env_setting == 'false':
-                self._use_rust = False
-            else:  # 'auto' or other values
-                self._use_rust = _RUST_AVAILABLE
-        else:
-            self._use_rust = use_rust and _RUST_AVAILABLE
+        self._use_rust = _should_use_rust(use_rust)
         
         # Initialize the appropriate implementation
         if self._use_rust:
@@ -127,18 +137,7 @@ class AgentMessage:
         Returns:
             Deserialized AgentMessage instance
         """
-        # Check if Rust implementation should be used
-        if use_rust is None:
-            # Check environment variable
-            env_setting = os.getenv('FAST_CREWAI_SERIALIZATION', 'auto').lower()
-            if env_setting == 'true':
-                use_rust = True
-            elif env_setting == 'false':
-                use_rust = False
-            else:  # 'auto' or other values
-                use_rust = _RUST_AVAILABLE
-        
-        if use_rust and _RUST_AVAILABLE:
+        if _should_use_rust(use_rust):
             try:
                 rust_message = _AgentMessage.from_json(json_str)
                 return cls(
@@ -147,7 +146,7 @@ class AgentMessage:
                     recipient=rust_message.recipient,
                     content=rust_message.content,
                     timestamp=rust_message.timestamp,
-                    use_rust=use_rust
+                    use_rust=True
                 )
             except Exception as e:
                 # Fallback to Python implementation on error
@@ -163,6 +162,107 @@ class AgentMessage:
             use_rust=False
         )
     
+    @classmethod
+    def batch_new(
+        cls,
+        records: Iterable[Tuple[str, str, str, str, int]],
+        use_rust: Optional[bool] = None
+    ) -> List['AgentMessage']:
+        """
+        Create many messages at once.
+        
+        With the Rust backend all records cross the boundary in a single
+        call instead of one constructor call per message.
+        
+        Args:
+            records: (id, sender, recipient, content, timestamp) tuples
+            use_rust: Whether to use the Rust implementation
+            
+        Returns:
+            List of AgentMessage instances, in record order
+        """
+        records = list(records)
+        
+        if _should_use_rust(use_rust):
+            try:
+                return [cls._from_rust(message) for message in _AgentMessage.batch_new(records)]
+            except Exception as e:
+                # Fallback to Python implementation on error
+                print(f"Warning: Rust batch construction failed, using Python fallback: {e}")
+        return [cls(*record, use_rust=False) for record in records]
+    
+    @classmethod
+    def to_json_batch(
+        cls,
+        messages: Iterable['AgentMessage'],
+        use_rust: Optional[bool] = None
+    ) -> List[str]:
+        """
+        Serialize many messages at once.
+        
+        When every message is backed by the Rust implementation the whole
+        batch is serialized in a single call.
+        
+        Args:
+            messages: Messages to serialize
+            use_rust: Whether to use the Rust implementation
+            
+        Returns:
+            List of JSON strings, in message order
+        """
+        messages = list(messages)
+        
+        if _should_use_rust(use_rust) and all(m._message is not None for m in messages):
+            try:
+                return _AgentMessage.to_json_batch([m._message for m in messages])
+            except Exception as e:
+                # Fallback to Python implementation on error
+                print(f"Warning: Rust batch serialization failed, using Python fallback: {e}")
+        return [message._python_to_json() for message in messages]
+    
+    @classmethod
+    def from_json_batch(
+        cls,
+        json_strs: Iterable[str],
+        use_rust: Optional[bool] = None
+    ) -> List['AgentMessage']:
+        """
+        Deserialize many messages at once.
+        
+        With the Rust backend all strings cross the boundary in a single
+        call instead of one from_json call per message.
+        
+        Args:
+            json_strs: JSON string representations of the messages
+            use_rust: Whether to use the Rust implementation
+            
+        Returns:
+            List of AgentMessage instances, in input order
+        """
+        json_strs = list(json_strs)
+        
+        if _should_use_rust(use_rust):
+            try:
+                return [cls._from_rust(message) for message in _AgentMessage.from_json_batch(json_strs)]
+            except Exception as e:
+                # Fallback to Python implementation on error
+                print(f"Warning: Rust batch deserialization failed, using Python fallback: {e}")
+        return [cls.from_json(json_str, use_rust=False) for json_str in json_strs]
+    
+    @classmethod
+    def _from_rust(cls, rust_message: Any) -> 'AgentMessage':
+        """Wrap an existing Rust message without constructing a new one."""
+        message = cls.__new__(cls)
+        message.id = rust_message.id
+        message.sender = rust_message.sender
+        message.recipient = rust_message.recipient
+        message.content = rust_message.content
+        message.timestamp = rust_message.timestamp
+        message._use_rust = True
+        message._message = rust_message
+        message._implementation = "rust"
+        return message
+    
     @property
     def implementation(self) -> str:
         """Get the current implementation type."""
@@ -191,61 +291,91 @@ class RustSerializer:
                      environment variables.
         """
         # Check if Rust implementation should be used
-        if use_rust is None:
-            # Check environment variable
-            env_setting = os.getenv('FAST_CREWAI_SERIALIZATION', 'auto').lower()
-            if env_setting == 'true':
-                self._use_rust = True
-            elif env_setting == 'false':
-                self._use_rust = False
-            else:  # 'auto' or other values
-                self._use_rust = _RUST_AVAILABLE
-        else:
-            self._use_rust = use_rust and _RUST_AVAILABLE
+        self._use_rust = _should_use_rust(use_rust)
     
-    def serialize_batch(self, messages: list) -> list:
+    def serialize_batch(
+        self,
+        messages: Optional[list] = None,
+        *,
+        ids: Optional[list] = None,
+        senders: Optional[list] = None,
+        recipients: Optional[list] = None,
+        contents: Optional[list] = None,
+        timestamps: Optional[list] = None
+    ) -> list:
         """
         Serialize a batch of messages efficiently.
         
+        Messages can be passed either as a list of dictionaries or as five
+        parallel columns. The columnar form crosses the Rust boundary once
+        per column instead of once per message.
+        
         Args:
             messages: List of message data dictionaries
+            ids: Message IDs (columnar form)
+            senders: Sender agent names (columnar form)
+            recipients: Recipient agent names (columnar form)
+            contents: Message contents (columnar form)
+            timestamps: Message timestamps (columnar form)
             
         Returns:
             List of JSON string representations
+            
+        Raises:
+            ValueError: If both forms, or an incomplete set of columns,
+                are passed
         """
+        if messages is not None:
+            if any(column is not None for column in (ids, senders, recipients, contents, timestamps)):
+                raise ValueError(
+                    "serialize_batch() takes either messages or the message "
+                    "columns, not both"
+                )
+            ids = [str(m.get('id', '')) for m in messages]
+            senders = [str(m.get('sender', '')) for m in messages]
+            recipients = [str(m.get('recipient', '')) for m in messages]
+            contents = [str(m.get('content', '')) for m in messages]
+            timestamps = [int(m.get('timestamp', 0)) for m in messages]
+        
+        columns = (ids, senders, recipients, contents, timestamps)
+        if any(column is None for column in columns):
+            raise ValueError(
+                "serialize_batch() requires either messages or all of "
+                "ids, senders, recipients, contents and timestamps"
+            )
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("All message columns must have the same length")
+        
         if self._use_rust:
             try:
-                # Convert to AgentMessage objects and serialize
-                serialized_messages = []
-                for msg_data in messages:
-                    msg = AgentMessage(
-                        id=str(msg_data.get('id', '')),
-                        sender=str(msg_data.get('sender', '')),
-                        recipient=str(msg_data.get('recipient', '')),
-                        content=str(msg_data.get('content', '')),
-                        timestamp=int(msg_data.get('timestamp', 0)),
-                        use_rust=True
-                    )
-                    serialized_messages.append(msg.to_json())
-                return serialized_messages
+                return _AgentMessage.serialize_columns(
+                    ids, senders, recipients, contents, timestamps
+                )
             except Exception as e:
-                # Fallback to Python implementation on error
+                # Fall back to Python for this batch only; a bad value in one
+                # batch says nothing about the next
                 print(f"Warning: Rust batch serialization failed, using Python fallback: {e}")
-                self._use_rust = False
-                return self._python_serialize_batch(messages)
-        else:
-            return self._python_serialize_batch(messages)
+        return self._python_serialize_batch(*columns)
     
-    def _python_serialize_batch(self, messages: list) -> list:
+    def _python_serialize_batch(
+        self,
+        ids: list,
+        senders: list,
+        recipients: list,
+        contents: list,
+        timestamps: list
+    ) -> list:
         """Python implementation of batch serialization for fallback."""
         serialized_messages = []
-        for msg_data in messages:
+        for message_id, sender, recipient, content, timestamp in zip(
+            ids, senders, recipients, contents, timestamps
+        ):
             data = {
-                'id': str(msg_data.get('id', '')),
-                'sender': str(msg_data.get('sender', '')),
-                'recipient': str(msg_data.get('recipient', '')),
-                'content': str(msg_data.get('content', '')),
-                'timestamp': int(msg_data.get('timestamp', 0))
+                'id': str(message_id),
+                'sender': str(sender),
+                'recipient': str(recipient),
+                'content': str(content),
+                'timestamp': int(timestamp)
             }
             serialized_messages.append(json.dumps(data, separators=(',', ':')))
         return serialized_messages
@@ -1,322 +1,534 @@
 """
-Bootstrap script to automatically shim fast-crewai components into CrewAI.
+Monkey patching system that shims fast-crewai components into CrewAI.
 Usage:
-    import crewai
-    import fast_crewai.shim  # This automatically replaces components
-    
+    import fast_crewai
+    fast_crewai.install()  # Call once at startup
+
 Or:
-    import crewai
     from fast_crewai.shim import enable_acceleration
     enable_acceleration()
+
+Importing this module has no side effects; ``import fast_crewai._bootstrap``
+enables acceleration on import instead.
+
+Patches for CrewAI modules that are not imported yet are deferred: a finder
+on ``sys.meta_path`` applies them right after the module is first imported,
+so enabling acceleration never imports CrewAI subsystems on its own.
 """
 
+import os
 import sys
+import csv
+import time
+import logging
+import threading
+import functools
 import importlib
-from typing import Any
+import importlib.abc
+import importlib.machinery
+import importlib.util
+from types import ModuleType
+from typing import Any, Dict, Final, List, Optional, Sequence, Set, Tuple
+
+# Silent unless the application (or verbose mode) configures logging
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Track original classes to allow restoration, keyed by (module path, class name)
+_original_classes: Dict[Tuple[str, str], Any] = {}
+
+# Class attribute set on every class we patch in, so disable_acceleration()
+# only restores names that still point at one of our replacements
+_ACCELERATED_MARKER = '_fast_crewai_accelerated'
+
+# Replacements per category: (target module, target class, "module:attribute"
+# of the accelerated class). Accelerated classes are imported only when their
+# target module is patched.
+_MEMORY_PATCHES: Final[Tuple[Tuple[str, str, str], ...]] = (
+    ('crewai.memory.storage.rag_storage', 'RAGStorage',
+     'fast_crewai.memory:AcceleratedRAGStorage'),
+    ('crewai.memory.short_term.short_term_memory', 'ShortTermMemory',
+     'fast_crewai.memory:AcceleratedShortTermMemory'),
+    ('crewai.memory.memory', 'Memory',
+     'fast_crewai.memory:AcceleratedMemory'),
+    ('crewai.memory.long_term.long_term_memory', 'LongTermMemory',
+     'fast_crewai.memory:AcceleratedLongTermMemory'),
+    ('crewai.memory.entity.entity_memory', 'EntityMemory',
+     'fast_crewai.memory:AcceleratedEntityMemory'),
+)
+
+# Tool and task classes use dynamic inheritance: the accelerated classes
+# subclass CrewAI's BaseTool, CrewStructuredTool, Task and Crew
+_TOOL_PATCHES: Final[Tuple[Tuple[str, str, str], ...]] = (
+    ('crewai.tools.base_tool', 'BaseTool',
+     'fast_crewai.tools:AcceleratedBaseTool'),
+    ('crewai.tools.structured_tool', 'CrewStructuredTool',
+     'fast_crewai.tools:AcceleratedStructuredTool'),
+)
+
+_TASK_PATCHES: Final[Tuple[Tuple[str, str, str], ...]] = (
+    ('crewai.task', 'Task', 'fast_crewai.tasks:AcceleratedTask'),
+    ('crewai.crew', 'Crew', 'fast_crewai.tasks:AcceleratedCrew'),
+)
+
+_DATABASE_PATCHES: Final[Tuple[Tuple[str, str, str], ...]] = (
+    ('crewai.memory.storage.ltm_sqlite_storage', 'LTMSQLiteStorage',
+     'fast_crewai.database:AcceleratedLTMSQLiteStorage'),
+    ('crewai.memory.storage.kickoff_task_outputs_storage', 'KickoffTaskOutputsSQLiteStorage',
+     'fast_crewai.database:AcceleratedKickoffTaskOutputsSQLiteStorage'),
+)
+
+# Serialization acceleration is provided through the AgentMessage class,
+# which can be used directly. System-wide JSON functions are not patched
+# to avoid compatibility issues.
+_SERIALIZATION_PATCHES: Final[Tuple[Tuple[str, str, str], ...]] = ()
+
+_PATCH_TABLE: Final[Dict[str, Tuple[Tuple[str, str, str], ...]]] = {
+    'memory': _MEMORY_PATCHES,
+    'tool': _TOOL_PATCHES,
+    'task': _TASK_PATCHES,
+    'database': _DATABASE_PATCHES,
+    'serialization': _SERIALIZATION_PATCHES,
+}
+
+
+def _group_by_module(
+    patches: Sequence[Tuple[str, str, str]]
+) -> Dict[str, Tuple[Tuple[str, str], ...]]:
+    """Group ``(module, class, accelerator)`` patches by target module."""
+    grouped: Dict[str, List[Tuple[str, str]]] = {}
+    for module_path, class_name, accelerator in patches:
+        grouped.setdefault(module_path, []).append((class_name, accelerator))
+    return {module_path: tuple(pairs) for module_path, pairs in grouped.items()}
+
+
+# _PATCH_TABLE grouped by target module, computed once so each module is
+# resolved once per enable_acceleration() call
+_PATCHES_BY_MODULE: Final[Dict[str, Dict[str, Tuple[Tuple[str, str], ...]]]] = {
+    category: _group_by_module(patches) for category, patches in _PATCH_TABLE.items()
+}
+
+# Summary lines printed in verbose mode for categories with applied patches
+_IMPROVEMENT_MESSAGES = {
+    'memory': "Memory Storage: 2-5x faster",
+    'tool': "Tool Execution: Acceleration hooks enabled",
+    'task': "Task Execution: Acceleration hooks enabled",
+    'database': "Database Operations: 2-4x faster",
+    'serialization': "Serialization: Accelerated JSON processing",
+}
+
+# Patches waiting for their target module to be imported, keyed by module path
+_pending_patches: Dict[str, List[Tuple[str, str]]] = {}
+
+# Guards _pending_patches and the timing report, which every importing
+# thread reads and updates. Accelerated classes are resolved outside of it:
+# resolving imports modules, and waiting for another thread's import while
+# holding the lock could deadlock with that thread.
+_patch_lock = threading.RLock()
+
+# Seconds spent importing each target module and accelerator module, recorded
+# while profiling is on (verbose mode or FAST_CREWAI_PROFILE_PATH set)
+_patch_timings: Dict[str, float] = {}
+_profiling = False
+
+# Where and how timings are reported; set by enable_acceleration() so that
+# deferred patches can report the imports they trigger later on
+_profile_verbose = False
+_profile_path: Optional[str] = None
+
+# Modules whose timing was already logged in verbose mode
+_reported_timings: Set[str] = set()
+
+
+class _PatchState(threading.local):
+    """
+    Per-thread state of ``_apply_pending_patches``.
+
+    Each thread patches the target modules it imported itself, so a module
+    is patched before its import returns and none is left behind by another
+    thread's drain.
+    """
+
+    def __init__(self):
+        # Target modules that finished executing and still have to be patched
+        self.loaded_modules: List[str] = []
+        # Set while pending patches are applied, so imports triggered while
+        # resolving an accelerated class don't re-enter the patching loop
+        self.applying = False
 
-# Track original classes to allow restoration
-_original_classes = {}
 
-def _monkey_patch_class(module_path: str, class_name: str, new_class: Any) -> bool:
+_patch_state = _PatchState()
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve(module_path: str) -> ModuleType:
     """
-    Replace a class in a module with a new implementation.
-    
-    Args:
-        module_path: Path to the module (e.g., 'crewai.memory')
-        class_name: Name of the class to replace
-        new_class: New class implementation
-        
-    Returns:
-        bool: True if successful, False otherwise
+    Return the module for ``module_path``, importing it if needed.
+
+    Cached so repeated enable_acceleration() calls don't repeat the lookups;
+    disable_acceleration() clears the cache to drop stale module references.
+    While profiling, the time of an actual import is recorded in
+    ``_patch_timings``; modules that are already loaded cost nothing here.
     """
-    try:
-        # Import the module
-        if module_path in sys.modules:
-            module = sys.modules[module_path]
-        else:
-            module = importlib.import_module(module_path)
-        
-        # Save original class if it exists
-        if hasattr(module, class_name):
-            original_class = getattr(module, class_name)
-            _original_classes[f"{module_path}.{class_name}"] = original_class
-        
-        # Replace the class
-        setattr(module, class_name, new_class)
-        return True
-        
-    except Exception as e:
-        # Only print debug info if in verbose mode
-        return False
+    module = sys.modules.get(module_path)
+    if module is not None:
+        return module
+
+    if not _profiling:
+        return importlib.import_module(module_path)
+
+    start = time.perf_counter()
+    module = importlib.import_module(module_path)
+    _patch_timings[module_path] = time.perf_counter() - start
+    return module
 
-def _patch_memory_components():
-    """Patch memory-related components."""
-    patches_applied = 0
-    patches_failed = 0
-    
-    try:
-        from fast_crewai.memory import AcceleratedMemoryStorage
-        
-        # Patch main memory storage components with correct module paths
-        memory_patches = [
-            ('crewai.memory.storage.rag_storage', 'RAGStorage', AcceleratedMemoryStorage),
-            ('crewai.memory.short_term.short_term_memory', 'ShortTermMemory', AcceleratedMemoryStorage),
-            ('crewai.memory.memory', 'Memory', AcceleratedMemoryStorage),
-            ('crewai.memory.long_term.long_term_memory', 'LongTermMemory', AcceleratedMemoryStorage),
-            ('crewai.memory.entity.entity_memory', 'EntityMemory', AcceleratedMemoryStorage),
-        ]
-        
-        for module_path, class_name, new_class in memory_patches:
-            if _monkey_patch_class(module_path, class_name, new_class):
-                patches_applied += 1
-            else:
-                patches_failed += 1
-                
-    except Exception as e:
-        print(f"⚠️  Memory component patching failed: {e}")
-        patches_failed += 1
-        
-    return patches_applied, patches_failed
 
-def _patch_tool_components():
+def _report_patch_timings(verbose: bool, profile_path: Optional[str]) -> None:
     """
-    Patch tool-related components with dynamically inherited accelerated classes.
+    Log the timings recorded since the last report and save all of them.
 
-    Uses dynamic inheritance to create accelerated versions that properly inherit
-    from CrewAI's BaseTool and CrewStructuredTool classes.
+    Called when acceleration is enabled and again whenever deferred patches
+    were applied, so the report follows the imports as they happen. The CSV
+    written to ``profile_path`` is rewritten with all ``module,seconds`` rows,
+    slowest first, and is meant for spotting patches whose accelerator costs
+    more to import than it saves. Failing to write it is logged, not raised.
     """
-    patches_applied = 0
-    patches_failed = 0
+    timings = sorted(_patch_timings.items(), key=lambda item: item[1], reverse=True)
 
-    try:
-        from fast_crewai.tools import AcceleratedBaseTool, AcceleratedStructuredTool
+    new_timings = [item for item in timings if item[0] not in _reported_timings]
+    if verbose and new_timings:
+        logger.info("Import time per module (slowest first):")
+        for module_path, seconds in new_timings:
+            logger.info("  %10.2f ms  %s", seconds * 1000, module_path)
+    _reported_timings.update(module_path for module_path, _ in new_timings)
 
-        # Only patch if the accelerated classes were successfully created
-        if AcceleratedBaseTool is not None:
-            tool_patches = [
-                ('crewai.tools.base_tool', 'BaseTool', AcceleratedBaseTool),
-            ]
+    if profile_path:
+        # Profiling is a diagnostic; never let it break enabling or imports
+        try:
+            with open(profile_path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['module', 'seconds'])
+                writer.writerows(timings)
+        except OSError as e:
+            logger.warning("Could not write import profile to %s: %s", profile_path, e)
 
-            for module_path, class_name, new_class in tool_patches:
-                if _monkey_patch_class(module_path, class_name, new_class):
-                    patches_applied += 1
-                else:
-                    patches_failed += 1
 
-        if AcceleratedStructuredTool is not None:
-            structured_patches = [
-                ('crewai.tools.structured_tool', 'CrewStructuredTool', AcceleratedStructuredTool),
-            ]
+def _mark_accelerated(new_class: Any) -> Any:
+    """Tag ``new_class`` as one of our replacements and return it."""
+    setattr(new_class, _ACCELERATED_MARKER, True)
+    return new_class
 
-            for module_path, class_name, new_class in structured_patches:
-                if _monkey_patch_class(module_path, class_name, new_class):
-                    patches_applied += 1
-                else:
-                    patches_failed += 1
 
-    except ImportError:
-        # CrewAI not installed, skip patching
-        pass
-    except Exception as e:
-        # Unexpected error, log and continue
-        patches_failed += 1
+def _is_accelerated(value: Any) -> bool:
+    """Whether ``value`` is a class tagged by ``_mark_accelerated``."""
+    # Check the class's own namespace so third-party subclasses don't match
+    return isinstance(value, type) and value.__dict__.get(_ACCELERATED_MARKER, False)
+
 
-    return patches_applied, patches_failed
+def _resolve_accelerator(accelerator: str) -> Any:
+    """Import and return the accelerated class named by ``"module:attribute"``."""
+    module_name, _, attribute = accelerator.partition(':')
+    return getattr(_resolve(module_name), attribute)
 
-def _patch_task_components():
+
+class _ShimLoader:
     """
-    Patch task-related components with dynamically inherited accelerated classes.
+    Loader wrapper that applies pending patches once a target module executed.
 
-    Uses dynamic inheritance to create accelerated versions that properly inherit
-    from CrewAI's Task and Crew classes.
+    Everything except ``exec_module`` is delegated to the wrapped loader.
     """
-    patches_applied = 0
-    patches_failed = 0
 
-    try:
-        from fast_crewai.tasks import AcceleratedTask, AcceleratedCrew
+    def __init__(self, loader: Any):
+        self._loader = loader
 
-        # Only patch if the accelerated classes were successfully created
-        if AcceleratedTask is not None:
-            task_patches = [
-                ('crewai.task', 'Task', AcceleratedTask),
-            ]
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
 
-            for module_path, class_name, new_class in task_patches:
-                if _monkey_patch_class(module_path, class_name, new_class):
-                    patches_applied += 1
-                else:
-                    patches_failed += 1
+    def exec_module(self, module):
+        # Hand the module back to its real loader before running it
+        module.__spec__.loader = self._loader
+        module.__loader__ = self._loader
+        start = time.perf_counter()
+        self._loader.exec_module(module)
+        if _profiling:
+            _patch_timings[module.__name__] = time.perf_counter() - start
+        _patch_state.loaded_modules.append(module.__name__)
+        _apply_pending_patches()
 
-        if AcceleratedCrew is not None:
-            crew_patches = [
-                ('crewai.crew', 'Crew', AcceleratedCrew),
-            ]
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
 
-            for module_path, class_name, new_class in crew_patches:
-                if _monkey_patch_class(module_path, class_name, new_class):
-                    patches_applied += 1
-                else:
-                    patches_failed += 1
 
-    except ImportError:
-        # CrewAI not installed, skip patching
-        pass
-    except Exception as e:
-        # Unexpected error, log and continue
-        patches_failed += 1
+class _ShimFinder(importlib.abc.MetaPathFinder):
+    """
+    Meta path finder that hooks the import of modules with pending patches.
 
-    return patches_applied, patches_failed
+    The spec itself is produced by the remaining finders; only its loader is
+    wrapped with ``_ShimLoader``. Pure-Python targets are additionally wrapped
+    in ``importlib.util.LazyLoader``, so their body (and heavy dependencies
+    such as vector stores) only runs on first attribute access. Patches are
+    applied right after that deferred execution.
+    """
 
-def _patch_database_components():
-    """Patch database-related components."""
-    patches_applied = 0
-    patches_failed = 0
-    
-    try:
-        from fast_crewai.database import AcceleratedSQLiteWrapper
-        
-        # Patch database components with correct class names
-        database_patches = [
-            ('crewai.memory.storage.ltm_sqlite_storage', 'LTMSQLiteStorage', AcceleratedSQLiteWrapper),
-            ('crewai.memory.storage.kickoff_task_outputs_storage', 'KickoffTaskOutputsSQLiteStorage', AcceleratedSQLiteWrapper),
-        ]
-        
-        for module_path, class_name, new_class in database_patches:
-            if _monkey_patch_class(module_path, class_name, new_class):
-                patches_applied += 1
+    def find_spec(self, fullname, path, target=None):
+        if fullname not in _pending_patches:
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is None or not hasattr(spec.loader, 'exec_module'):
+                return spec
+            if isinstance(spec.loader, importlib.machinery.SourceFileLoader):
+                spec.loader = importlib.util.LazyLoader(_ShimLoader(spec.loader))
             else:
-                patches_failed += 1
-                
-    except Exception as e:
-        print(f"⚠️  Database component patching failed: {e}")
-        patches_failed += 1
-        
-    return patches_applied, patches_failed
+                spec.loader = _ShimLoader(spec.loader)
+            return spec
+
+        return None
+
+
+_finder = _ShimFinder()
 
-def _patch_serialization_components():
+
+def _install_finder() -> None:
+    """Insert the shim finder at the front of ``sys.meta_path`` (once)."""
+    if _finder not in sys.meta_path:
+        sys.meta_path.insert(0, _finder)
+
+
+def _apply_pending_patches() -> None:
+    """Apply the pending patches of the target modules this thread loaded."""
+    state = _patch_state
+    if state.applying:
+        # The outer call picks up modules loaded while resolving accelerators
+        return
+
+    state.applying = True
+    try:
+        while state.loaded_modules:
+            module_path = state.loaded_modules.pop(0)
+            with _patch_lock:
+                patches = _pending_patches.pop(module_path, None)
+            if not patches:
+                continue
+            try:
+                _patch_module(module_path, patches)
+            except Exception as e:
+                logger.warning("Deferred patching of %s failed: %s", module_path, e)
+
+        if _profiling:
+            with _patch_lock:
+                _report_patch_timings(_profile_verbose, _profile_path)
+    finally:
+        state.applying = False
+
+
+def _defer_patches(module_path: str, patches: Sequence[Tuple[str, str]]) -> None:
     """
-    Patch serialization-related components.
+    Record patches for a module that isn't imported yet.
 
-    Note: Serialization acceleration could patch JSON encoding/decoding functions,
-    but this is not yet implemented. Event classes should not be replaced.
+    Args:
+        module_path: Path to the module (e.g., 'crewai.memory')
+        patches: (class name, accelerated class as ``"module:attribute"``) pairs
     """
-    patches_applied = 0
-    patches_failed = 0
+    with _patch_lock:
+        pending = _pending_patches.setdefault(module_path, [])
+        for class_name, accelerator in patches:
+            if all(name != class_name for name, _ in pending):
+                pending.append((class_name, accelerator))
+    _install_finder()
 
-    # Serialization patching: Could accelerate json.dumps/json.loads with Rust implementations
-    # However, this is complex and may have compatibility issues, so it's not implemented yet.
-    # Future implementation could:
-    # 1. Monkey-patch json.dumps and json.loads with faster implementations
-    # 2. Use orjson or similar high-performance JSON libraries
-    # 3. Add Rust-based JSON encoding/decoding in the _core module
 
-    # For now, serialization acceleration is provided through the AgentMessage class
-    # which can be used directly for message serialization, but we don't patch
-    # system-wide JSON functions to avoid compatibility issues.
+def _patch_module(module_path: str, patches: Sequence[Tuple[str, str]]) -> int:
+    """
+    Replace several classes of one module, resolving the module only once.
 
-    return patches_applied, patches_failed
+    Errors are not caught here so that callers can report them.
+
+    Args:
+        module_path: Path to the module (e.g., 'crewai.memory')
+        patches: (class name, accelerated class as ``"module:attribute"``) pairs
+
+    Returns:
+        int: Number of classes replaced. Accelerated classes that could not
+        be created (e.g. CrewAI not installed) are skipped.
+    """
+    namespace = _resolve(module_path).__dict__
+
+    applied = 0
+    for class_name, accelerator in patches:
+        new_class = _resolve_accelerator(accelerator)
+        if new_class is None:
+            continue
+
+        # Save original class if it exists; keep the first one seen so that
+        # repeated enable calls don't record our own replacement as original
+        original_class = namespace.get(class_name)
+        if original_class is not None:
+            _original_classes.setdefault((module_path, class_name), original_class)
+
+        # Replace the class (direct __dict__ write skips the setattr slow path)
+        namespace[class_name] = _mark_accelerated(new_class)
+        applied += 1
+
+    return applied
+
+
+def _apply_category(category: str) -> Tuple[int, int, int]:
+    """
+    Apply (or defer) every patch of a ``_PATCH_TABLE`` category.
+
+    Patches are applied per target module (see ``_PATCHES_BY_MODULE``);
+    those for modules that aren't imported yet are deferred. The first error
+    aborts the category and is reported.
+
+    Returns:
+        Tuple of (applied, deferred, failed) patch counts
+    """
+    applied = deferred = failed = 0
+
+    try:
+        for module_path, patches in _PATCHES_BY_MODULE[category].items():
+            if module_path in sys.modules:
+                applied += _patch_module(module_path, patches)
+            else:
+                _defer_patches(module_path, patches)
+                deferred += len(patches)
+    except Exception as e:
+        logger.warning("%s component patching failed: %s", category.capitalize(), e)
+        failed += 1
+
+    return applied, deferred, failed
 
 def enable_acceleration(verbose: bool = False) -> bool:
     """
     Monkey patch CrewAI components with accelerated equivalents.
     This function replaces CrewAI's core components with their accelerated counterparts.
+
+    Components whose CrewAI module is already imported are patched right away;
+    the others are patched as soon as the module is imported.
+    
+    In verbose mode, or when FAST_CREWAI_PROFILE_PATH names a CSV file, the
+    import time of every target and accelerator module is recorded and
+    reported, including imports that happen later and trigger deferred
+    patches.
+    
+    Diagnostics go to the ``fast_crewai.shim`` logger; verbose mode also
+    configures basic INFO-level logging so that they are shown.
     
     Args:
-        verbose: Whether to print detailed information about patching
+        verbose: Whether to log detailed information about patching
         
     Returns:
-        bool: True if successful, False otherwise
+        bool: True if any patch was applied or deferred, False otherwise
+        (including when CrewAI is not installed)
     """
+    global _profiling, _profile_verbose, _profile_path
+
+    if verbose:
+        logging.basicConfig(level=logging.INFO)
+
+    profile_path = os.environ.get('FAST_CREWAI_PROFILE_PATH')
+    _profiling = verbose or bool(profile_path)
+    _profile_verbose = verbose
+    _profile_path = profile_path
+
     try:
-        total_patches_applied = 0
-        total_patches_failed = 0
-        
         if verbose:
-            print("🚀 Enabling acceleration for CrewAI...")
+            logger.info("Enabling acceleration for CrewAI...")
+
+        # Without CrewAI every patch would be deferred forever
+        if 'crewai' not in sys.modules and importlib.util.find_spec('crewai') is None:
+            logger.warning("CrewAI is not installed; nothing to accelerate")
+            return False
         
-        # Patch each component type
-        memory_applied, memory_failed = _patch_memory_components()
-        total_patches_applied += memory_applied
-        total_patches_failed += memory_failed
-
-        tool_applied, tool_failed = _patch_tool_components()
-        total_patches_applied += tool_applied
-        total_patches_failed += tool_failed
-
-        task_applied, task_failed = _patch_task_components()
-        total_patches_applied += task_applied
-        total_patches_failed += task_failed
-
-        db_applied, db_failed = _patch_database_components()
-        total_patches_applied += db_applied
-        total_patches_failed += db_failed
-
-        serialization_applied, serialization_failed = _patch_serialization_components()
-        total_patches_applied += serialization_applied
-        total_patches_failed += serialization_failed
+        results = {category: _apply_category(category) for category in _PATCH_TABLE}
+        total_patches_applied = sum(applied for applied, _, _ in results.values())
+        total_patches_deferred = sum(deferred for _, deferred, _ in results.values())
+        total_patches_failed = sum(failed for _, _, failed in results.values())
         
         if verbose:
-            print(f"✅ Acceleration bootstrap completed!")
-            print(f"  - Memory patches applied: {memory_applied}, failed: {memory_failed}")
-            print(f"  - Tool patches applied: {tool_applied}, failed: {tool_failed}")
-            print(f"  - Task patches applied: {task_applied}, failed: {task_failed}")
-            print(f"  - Database patches applied: {db_applied}, failed: {db_failed}")
-            print(f"  - Serialization patches: {serialization_applied} (not yet implemented)")
-            print(f"  - Total patches applied: {total_patches_applied}")
-            print(f"  - Total patches failed: {total_patches_failed}")
+            logger.info("Acceleration bootstrap completed!")
+            for category, (applied, deferred, failed) in results.items():
+                if _PATCH_TABLE[category]:
+                    logger.info("  - %s patches applied: %d, deferred: %d, failed: %d",
+                                category.capitalize(), applied, deferred, failed)
+                else:
+                    logger.info("  - %s patches: %d (not yet implemented)",
+                                category.capitalize(), applied)
+            logger.info("  - Total patches applied: %d", total_patches_applied)
+            logger.info("  - Total patches deferred until import: %d", total_patches_deferred)
+            logger.info("  - Total patches failed: %d", total_patches_failed)
 
         if total_patches_applied > 0 and verbose:
-            print("\n🚀 Performance improvements now active:")
-            if memory_applied > 0:
-                print("  - Memory Storage: 2-5x faster")
-            if db_applied > 0:
-                print("  - Database Operations: 2-4x faster")
-            if tool_applied > 0:
-                print("  - Tool Execution: Acceleration hooks enabled")
-            if task_applied > 0:
-                print("  - Task Execution: Acceleration hooks enabled")
-            if serialization_applied > 0:
-                print("  - Serialization: Accelerated JSON processing")
+            logger.info("Performance improvements now active:")
+            for category, (applied, _, _) in results.items():
+                if applied > 0:
+                    logger.info("  - %s", _IMPROVEMENT_MESSAGES[category])
+
+        if _profiling:
+            with _patch_lock:
+                _report_patch_timings(verbose, profile_path)
         
-        return total_patches_applied > 0
+        return total_patches_applied + total_patches_deferred > 0
         
     except ImportError as e:
-        if verbose:
-            print(f"⚠️  Acceleration components not available: {e}")
+        logger.warning("Acceleration components not available: %s", e)
         return False
     except Exception as e:
-        if verbose:
-            print(f"❌ Failed to enable acceleration: {e}")
+        logger.error("Failed to enable acceleration: %s", e)
         return False
 
 def disable_acceleration() -> bool:
     """
     Restore original CrewAI components.
     
+    Only names that still point at one of our replacements are restored;
+    names that were patched again by someone else are left alone. Calling
+    this more than once is safe.
+    
     Returns:
         bool: True if successful, False otherwise
     """
+    global _profiling
+
     try:
         restored = 0
-        for full_path, original_class in _original_classes.items():
-            try:
-                module_path, class_name = full_path.rsplit('.', 1)
-                if module_path in sys.modules:
-                    module = sys.modules[module_path]
-                    setattr(module, class_name, original_class)
-                    restored += 1
-            except Exception:
+        for (module_path, class_name), original_class in _original_classes.items():
+            module = sys.modules.get(module_path)
+            if module is None:
                 continue
+
+            current = module.__dict__.get(class_name)
+            if current is original_class:
+                continue
+            if _is_accelerated(current):
+                module.__dict__[class_name] = original_class
+                restored += 1
+            else:
+                logger.warning("Skipping restore of %s.%s: third-party patch detected",
+                               module_path, class_name)
         
         _original_classes.clear()
-        print(f"✅ Restored {restored} original classes")
+        _resolve.cache_clear()
+
+        # Stop recording import times for deferred patches
+        _profiling = False
+
+        # Drop deferred patches so later CrewAI imports stay untouched
+        with _patch_lock:
+            _pending_patches.clear()
+        del _patch_state.loaded_modules[:]
+        if _finder in sys.meta_path:
+            sys.meta_path.remove(_finder)
+
+        logger.info("Restored %d original classes", restored)
         return True
         
     except Exception as e:
-        print(f"❌ Failed to restore original classes: {e}")
+        logger.error("Failed to restore original classes: %s", e)
         return False
-
-# Auto-enable when imported as a module (but not when run as main)
-if __name__ != "__main__":
-    enable_acceleration()
\ No newline at end of file
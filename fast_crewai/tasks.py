@@ -13,7 +13,7 @@ from ._constants import HAS_ACCELERATION_IMPLEMENTATION
 # Try to import the Rust implementation
 if HAS_ACCELERATION_IMPLEMENTATION:
     try:
-        from ._core import AcceleratedTaskExecutor as _RustTaskExecutor
+        from ._core import RustTaskExecutor as _RustTaskExecutor
         _RUST_AVAILABLE = True
     except ImportError:
         _RUST_AVAILABLE = False
@@ -148,9 +148,23 @@ def create_accelerated_crew():
         return None
 
 
-# Create the accelerated classes
-AcceleratedTask = create_accelerated_task()
-AcceleratedCrew = create_accelerated_crew()
+# The accelerated classes subclass CrewAI classes, so they are created on
+# first access instead of at import time; importing this module must not
+# import CrewAI.
+_ACCELERATED_CLASS_FACTORIES = {
+    'AcceleratedTask': create_accelerated_task,
+    'AcceleratedCrew': create_accelerated_crew,
+}
+
+
+def __getattr__(name):
+    factory = _ACCELERATED_CLASS_FACTORIES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    accelerated_class = factory()
+    globals()[name] = accelerated_class
+    return accelerated_class
 
 
 # Legacy executor class (kept for backwards compatibility)
@@ -178,6 +192,9 @@ class AcceleratedTaskExecutor:
                      environment variables.
         """
         self.max_concurrent_tasks = max_concurrent_tasks
+        # Tasks still run through the Python path, so the limit is tracked
+        # for both implementations
+        self._active_tasks = 0
 
         # Check if Rust implementation should be used
         if use_rust is None:
@@ -195,18 +212,16 @@ class AcceleratedTaskExecutor:
         # Initialize the appropriate implementation
         if self._use_rust:
             try:
-                self._executor = _RustTaskExecutor(max_concurrent_tasks)
+                self._executor = _RustTaskExecutor()
                 self._implementation = "rust"
             except Exception:
                 # Fallback to Python implementation
                 self._use_rust = False
                 self._executor = None
                 self._implementation = "python"
-                self._active_tasks = 0
         else:
             self._executor = None
             self._implementation = "python"
-            self._active_tasks = 0
 
     async def execute_task(
         self,
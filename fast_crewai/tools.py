@@ -9,13 +9,13 @@ import os
 import time
 import json
 import functools
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from ._constants import HAS_ACCELERATION_IMPLEMENTATION
 
 # Try to import the Rust implementation
 if HAS_ACCELERATION_IMPLEMENTATION:
     try:
-        from ._core import AcceleratedToolExecutor as _RustToolExecutor
+        from ._core import RustToolExecutor as _RustToolExecutor
         _RUST_AVAILABLE = True
     except ImportError:
         _RUST_AVAILABLE = False
@@ -159,9 +159,23 @@ def create_accelerated_structured_tool():
         return None
 
 
-# Create the accelerated classes
-AcceleratedBaseTool = create_accelerated_base_tool()
-AcceleratedStructuredTool = create_accelerated_structured_tool()
+# The accelerated classes subclass CrewAI classes, so they are created on
+# first access instead of at import time; importing this module must not
+# import CrewAI.
+_ACCELERATED_CLASS_FACTORIES = {
+    'AcceleratedBaseTool': create_accelerated_base_tool,
+    'AcceleratedStructuredTool': create_accelerated_structured_tool,
+}
+
+
+def __getattr__(name):
+    factory = _ACCELERATED_CLASS_FACTORIES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    accelerated_class = factory()
+    globals()[name] = accelerated_class
+    return accelerated_class
 
 
 # Legacy executor class (kept for backwards compatibility)
@@ -192,6 +206,8 @@ class AcceleratedToolExecutor:
         """
         self.max_recursion_depth = max_recursion_depth
         self.timeout_seconds = timeout_seconds
+        # Counted for the Python path, which the Rust path can fall back to
+        self._execution_count = 0
 
         # Check if Rust implementation should be used
         if use_rust is None:
@@ -216,11 +232,9 @@ class AcceleratedToolExecutor:
                 self._use_rust = False
                 self._executor = None
                 self._implementation = "python"
-                self._execution_count = 0
         else:
             self._executor = None
             self._implementation = "python"
-            self._execution_count = 0
 
     def execute_tool(
         self,
@@ -260,7 +274,7 @@ class AcceleratedToolExecutor:
                 # Handle specific Rust errors
                 error_str = str(e)
                 if "Maximum recursion depth exceeded" in error_str:
-                    raise Exception(f"Tool execution failed: Maximum recursion depth exceeded for tool '{tool_name}'")
+                    raise RecursionError(f"Tool execution failed: Maximum recursion depth exceeded for tool '{tool_name}'") from e
                 else:
                     # Fallback to Python implementation
                     self._use_rust = False
@@ -272,11 +286,59 @@ class AcceleratedToolExecutor:
         else:
             return self._python_execute_tool(tool_name, arguments)
 
+    def execute_tool_batch(self, calls: Iterable[Tuple[str, Any]]) -> List[Any]:
+        """
+        Execute several tools with one call into the backend.
+
+        With the Rust backend the whole batch crosses the boundary once
+        instead of once per tool.
+
+        Args:
+            calls: (tool_name, arguments) pairs
+
+        Returns:
+            Results of the tool executions, in call order
+
+        Raises:
+            RecursionError: If the maximum recursion depth is exceeded
+        """
+        calls = list(calls)
+
+        if self._use_rust:
+            try:
+                # Convert arguments to string format for Rust
+                batch = [
+                    (tool_name, json.dumps(arguments, default=str) if not isinstance(arguments, str) else arguments)
+                    for tool_name, arguments in calls
+                ]
+
+                # Execute using Rust backend
+                results = self._executor.execute_tool_batch(batch)
+
+                # Try to parse results as JSON, fallback to string
+                decoded = []
+                for result_str in results:
+                    try:
+                        decoded.append(json.loads(result_str))
+                    except (json.JSONDecodeError, TypeError):
+                        decoded.append(result_str)
+                return decoded
+
+            except RuntimeError as e:
+                # Handle specific Rust errors
+                if "Maximum recursion depth exceeded" in str(e):
+                    raise RecursionError("Tool execution failed: Maximum recursion depth exceeded in tool batch") from e
+            except Exception:
+                # Fall back to Python for this batch only
+                pass
+
+        return [self._python_execute_tool(tool_name, arguments) for tool_name, arguments in calls]
+
     def _python_execute_tool(self, tool_name: str, arguments: Any) -> Any:
         """Python implementation of tool execution for fallback."""
         # Check recursion limit
         if self._execution_count >= self.max_recursion_depth:
-            raise Exception(f"Tool execution failed: Maximum recursion depth exceeded for tool '{tool_name}'")
+            raise RecursionError(f"Tool execution failed: Maximum recursion depth exceeded for tool '{tool_name}'")
 
         # Increment execution count
         self._execution_count += 1
@@ -6,90 +6,58 @@ for working with the Rust components.
 """
 
 import os
-from typing import Optional
+import functools
+from typing import Optional, Tuple
 from ._constants import HAS_ACCELERATION_IMPLEMENTATION
 
 
+@functools.lru_cache(maxsize=None)
 def is_acceleration_available() -> bool:
     """
     Check if the Rust implementation is available.
     
+    The extension can't change within a process, so the answer is cached.
+    
     Returns:
         True if Rust components are available, False otherwise
     """
     return HAS_ACCELERATION_IMPLEMENTATION
 
 
+# Component name and the class the Rust extension (src/lib.rs) registers for it
+_CORE_COMPONENTS = (
+    ('memory', 'RustMemoryStorage'),
+    ('tools', 'RustToolExecutor'),
+    ('tasks', 'RustTaskExecutor'),
+    ('serialization', 'AgentMessage'),
+    ('database', 'RustSQLiteWrapper'),
+)
+
+
+def _probe_components() -> Tuple[Tuple[str, bool], ...]:
+    """Check which components the Rust extension provides."""
+    try:
+        from . import _core
+    except ImportError:
+        return tuple((component, False) for component, _ in _CORE_COMPONENTS)
+    return tuple((component, hasattr(_core, name)) for component, name in _CORE_COMPONENTS)
+
+
+@functools.lru_cache(maxsize=None)
 def get_acceleration_status() -> dict:
     """
     Get detailed status information about Rust components.
     
+    The extension is probed once per process and the same dictionary is
+    returned on every call; copy it before modifying it.
+    
     Returns:
         Dictionary with status information for each component
     """
-    status = {
+    return {
         'available': HAS_ACCELERATION_IMPLEMENTATION,
-        'components': {}
+        'components': dict(_probe_components()) if HAS_ACCELERATION_IMPLEMENTATION else {}
     }
-    
-    if HAS_ACCELERATION_IMPLEMENTATION:
-        try:
-            from ._core import (
-                AcceleratedMemoryStorage,
-                AcceleratedToolExecutor,
-                AcceleratedTaskExecutor,
-                AgentMessage,
-                AcceleratedSQLiteWrapper
-            )
-            status['components'] = {
-                'memory': True,
-                'tools': True,
-                'tasks': True,
-                'serialization': True,
-                'database': True
-            }
-        except ImportError as e:
-            # Try to identify which components are missing
-            status['components'] = {
-                'memory': False,
-                'tools': False,
-                'tasks': False,
-                'serialization': False,
-                'database': False
-            }
-            
-            # This is a simplified check - in practice, you'd want more detailed checking
-            try:
-                from ._core import AcceleratedMemoryStorage
-                status['components']['memory'] = True
-            except ImportError:
-                pass
-                
-            try:
-                from ._core import AcceleratedToolExecutor
-                status['components']['tools'] = True
-            except ImportError:
-                pass
-                
-            try:
-                from ._core import AcceleratedTaskExecutor
-                status['components']['tasks'] = True
-            except ImportError:
-                pass
-                
-            try:
-                from ._core import AgentMessage
-                status['components']['serialization'] = True
-            except ImportError:
-                pass
-                
-            try:
-                from ._core import AcceleratedSQLiteWrapper
-                status['components']['database'] = True
-            except ImportError:
-                pass
-    
-    return status
 
 
 def configure_accelerated_components(
@@ -412,10 +412,10 @@ def run_benchmark(
             # Ensure acceleration is disabled
             env.pop('FAST_CREWAI_ACCELERATION', None)
         
-        # Add fast_crewai.shim import if using acceleration
+        # Install fast_crewai if using acceleration
         cmd = [str(python_exe)]
         if use_acceleration:
-            cmd.extend(['-c', f'import fast_crewai.shim; exec(open("{workflow_script}").read())'])
+            cmd.extend(['-c', f'import fast_crewai; fast_crewai.install(); exec(open("{workflow_script}").read())'])
         else:
             cmd.append(str(workflow_script))
         
@@ -437,9 +437,9 @@ run_single_test() {
         
         start_time=$(date +%s.%N)
         
-        # Run with or without importing fast_crewai.shim
+        # Run with or without installing fast_crewai
         if [ "$use_acceleration" = "1" ]; then
-            python -c "import fast_crewai.shim; import os; os.environ['WORKFLOW_TYPE']='$WORKFLOW_TYPE'; exec(open('$TEST_DIR/crewai_test_workflow.py').read())"
+            python -c "import fast_crewai; fast_crewai.install(); import os; os.environ['WORKFLOW_TYPE']='$WORKFLOW_TYPE'; exec(open('$TEST_DIR/crewai_test_workflow.py').read())"
         else
             WORKFLOW_TYPE="$WORKFLOW_TYPE" python "$TEST_DIR/crewai_test_workflow.py"
         fi
@@ -217,7 +217,8 @@ os.environ['FAST_CREWAI_ACCELERATION'] = '1'
 
 # Import and activate the shim before any CrewAI imports
 try:
-    import fast_crewai.shim
+    import fast_crewai
+    fast_crewai.install()
     print("\n" + "="*80)
     print("Fast-CrewAI shim activated successfully!")
     print("="*80 + "\n")
@@ -234,7 +235,7 @@ try:
         print(f"Warning: Could not get acceleration status: {e}\n")
 
 except ImportError as e:
-    print(f"\nWarning: Could not import fast_crewai.shim: {e}")
+    print(f"\nWarning: Could not import fast_crewai: {e}")
     print("Tests will run with standard CrewAI implementation\n")
 except Exception as e:
     print(f"\nWarning: Error activating shim: {e}")
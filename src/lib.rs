@@ -1,5 +1,5 @@
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList, PyTuple};
+use pyo3::types::{PyDict, PyList, PyTuple, PyType};
 use serde::{Deserialize, Serialize};
 use std::sync::{Arc, Mutex};
 use std::collections::HashMap;
@@ -206,6 +206,49 @@ impl RustToolExecutor {
         
         Ok(result)
     }
+
+    /// Execute several (tool_name, args) calls in one boundary crossing.
+    /// The calls are siblings, so they share a single recursion level.
+    pub fn execute_tool_batch(
+        &self,
+        py: Python,
+        calls: Vec<(String, String)>,
+    ) -> PyResult<Vec<String>> {
+        let mut count = self.execution_count.lock().map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+                "Failed to acquire lock: {}",
+                e
+            ))
+        })?;
+        
+        if *count >= self.max_recursion_depth {
+            return Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+                "Maximum recursion depth exceeded".to_string(),
+            ));
+        }
+        
+        *count += 1;
+        drop(count); // Release the lock
+        
+        // Simulate tool execution without holding the GIL
+        let results = py.allow_threads(|| {
+            calls
+                .iter()
+                .map(|(tool_name, args)| format!("Executed {} with args: {}", tool_name, args))
+                .collect()
+        });
+        
+        // Decrement count after execution
+        let mut count = self.execution_count.lock().map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+                "Failed to acquire lock: {}",
+                e
+            ))
+        })?;
+        *count -= 1;
+        
+        Ok(results)
+    }
 }
 
 /// A message structure for serialization
@@ -255,6 +298,100 @@ impl AgentMessage {
             ))
         })
     }
+
+    /// Create many messages from (id, sender, recipient, content, timestamp)
+    /// records; the records are converted once and built without the GIL
+    #[classmethod]
+    pub fn batch_new(
+        _cls: &PyType,
+        py: Python,
+        records: Vec<(String, String, String, String, u64)>,
+    ) -> Vec<AgentMessage> {
+        py.allow_threads(|| {
+            records
+                .into_iter()
+                .map(|(id, sender, recipient, content, timestamp)| AgentMessage {
+                    id,
+                    sender,
+                    recipient,
+                    content,
+                    timestamp,
+                })
+                .collect()
+        })
+    }
+
+    /// Serialize many messages in a single call
+    #[staticmethod]
+    pub fn to_json_batch(messages: Vec<PyRef<AgentMessage>>) -> PyResult<Vec<String>> {
+        messages.iter().map(|message| message.to_json()).collect()
+    }
+
+    /// Deserialize many messages in a single call; parsing runs without the GIL
+    #[classmethod]
+    pub fn from_json_batch(
+        _cls: &PyType,
+        py: Python,
+        json_strs: Vec<String>,
+    ) -> PyResult<Vec<AgentMessage>> {
+        py.allow_threads(|| {
+            json_strs
+                .iter()
+                .map(|json_str| AgentMessage::from_json(json_str))
+                .collect()
+        })
+    }
+
+    /// Serialize a batch given as parallel columns in a single pass
+    #[staticmethod]
+    pub fn serialize_columns(
+        ids: Vec<&str>,
+        senders: Vec<&str>,
+        recipients: Vec<&str>,
+        contents: Vec<&str>,
+        timestamps: Vec<u64>,
+    ) -> PyResult<Vec<String>> {
+        let len = ids.len();
+        if senders.len() != len
+            || recipients.len() != len
+            || contents.len() != len
+            || timestamps.len() != len
+        {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                "All message columns must have the same length",
+            ));
+        }
+
+        let mut results = Vec::with_capacity(len);
+        for i in 0..len {
+            let message = AgentMessageRef {
+                id: ids[i],
+                sender: senders[i],
+                recipient: recipients[i],
+                content: contents[i],
+                timestamp: timestamps[i],
+            };
+            let json = serde_json::to_string(&message).map_err(|e| {
+                PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+                    "Failed to serialize to JSON: {}",
+                    e
+                ))
+            })?;
+            results.push(json);
+        }
+
+        Ok(results)
+    }
+}
+
+/// Borrowed view of a message used when serializing column batches
+#[derive(Serialize)]
+struct AgentMessageRef<'a> {
+    id: &'a str,
+    sender: &'a str,
+    recipient: &'a str,
+    content: &'a str,
+    timestamp: u64,
 }
 
 /// A concurrent task executor
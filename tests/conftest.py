@@ -3,12 +3,13 @@ Pytest configuration for CrewAI Rust tests.
 """
 
 import pytest
+import gc
 import os
 import sys
 
 
 def pytest_configure(config):
-    """Configure pytest with custom markers and settings."""
+    """Register custom markers and deselect tests based on command line options."""
     config.addinivalue_line(
         "markers",
         "integration: marks tests as integration tests (may require CrewAI)"
@@ -26,6 +27,82 @@ def pytest_configure(config):
         "rust_required: marks tests that require Rust acceleration to be available"
     )
 
+    if not config.option.run_slow:
+        config.option.markexpr = "not slow"
+
+    if not config.option.run_integration:
+        if config.option.markexpr:
+            config.option.markexpr += " and not integration"
+        else:
+            config.option.markexpr = "not integration"
+
+    if not config.option.run_performance:
+        if config.option.markexpr:
+            config.option.markexpr += " and not performance"
+        else:
+            config.option.markexpr = "not performance"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _package_location():
+    """
+    Fail if fast_crewai's own directory is on sys.path.
+
+    Its submodules would then also be importable as top-level modules,
+    loading every component (and the extension) twice. Install the package
+    (``pip install -e .``) or run with ``PYTHONPATH=.`` instead.
+    """
+    import fast_crewai
+    package_dir = os.path.dirname(os.path.abspath(fast_crewai.__file__))
+    assert all(
+        os.path.abspath(path or os.curdir) != package_dir for path in sys.path
+    ), f"{package_dir} must not be on sys.path"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _single_init():
+    """
+    Fail if the Rust extension is initialised more than once per session.
+
+    Without the extension the package module itself is tracked, which still
+    catches a reload or a second import under another name.
+    """
+    def loaded():
+        return sys.modules.get("fast_crewai._core", sys.modules.get("fast_crewai"))
+
+    import fast_crewai
+    first = id(loaded())
+    yield
+    assert id(loaded()) == first, "fast_crewai was imported more than once"
+
+
+@pytest.fixture(scope="module")
+def fast_crewai_mod():
+    """Import the fast_crewai package once per test module."""
+    import fast_crewai
+    return fast_crewai
+
+
+@pytest.fixture
+def no_gc():
+    """Keep the cyclic garbage collector from pausing timed sections."""
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+@pytest.fixture
+def accelerated():
+    """Patch CrewAI for one test and restore the original classes afterwards."""
+    import fast_crewai
+    from fast_crewai.shim import disable_acceleration
+
+    fast_crewai.install()
+    yield
+    disable_acceleration()
+
 
 @pytest.fixture(scope="session")
 def rust_available():
@@ -80,25 +157,27 @@ def clean_environment():
         sys.modules[module] = mod_obj
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def memory_storage():
-    """Provide a memory storage instance for testing."""
-    from fast_crewai import RustMemoryStorage
-    return RustMemoryStorage()
+    """Provide a memory storage instance shared by a test module."""
+    from fast_crewai import AcceleratedMemoryStorage
+    storage = AcceleratedMemoryStorage()
+    yield storage
+    storage.reset()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tool_executor():
-    """Provide a tool executor instance for testing."""
-    from fast_crewai import RustToolExecutor
-    return RustToolExecutor()
+    """Provide a tool executor instance shared by a test module."""
+    from fast_crewai import AcceleratedToolExecutor
+    return AcceleratedToolExecutor()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def task_executor():
-    """Provide a task executor instance for testing."""
-    from fast_crewai import RustTaskExecutor
-    return RustTaskExecutor()
+    """Provide a task executor instance shared by a test module."""
+    from fast_crewai import AcceleratedTaskExecutor
+    return AcceleratedTaskExecutor()
 
 
 @pytest.fixture
@@ -185,21 +264,3 @@ def pytest_addoption(parser):
         default=False,
         help="run performance tests"
     )
-
-
-def pytest_configure(config):
-    """Configure test collection based on command line options."""
-    if not config.option.run_slow:
-        config.option.markexpr = "not slow"
-
-    if not config.option.run_integration:
-        if config.option.markexpr:
-            config.option.markexpr += " and not integration"
-        else:
-            config.option.markexpr = "not integration"
-
-    if not config.option.run_performance:
-        if config.option.markexpr:
-            config.option.markexpr += " and not performance"
-        else:
-            config.option.markexpr = "not performance"
\ No newline at end of file
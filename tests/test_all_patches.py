@@ -26,8 +26,11 @@ def test_shim_loading():
     print("=" * 80)
 
     try:
-        import fast_crewai.shim
-        print("✅ Shim imported successfully")
+        import fast_crewai
+        if fast_crewai.install():
+            print("✅ Acceleration installed successfully")
+        else:
+            print("⚠️  Nothing to patch (CrewAI not installed)")
         return True
     except Exception as e:
         print(f"❌ Failed to import shim: {e}")
@@ -219,6 +222,12 @@ def test_crewai_patching():
         return False
 
 
+def teardown_module():
+    """Restore CrewAI's classes once pytest has run this module."""
+    from fast_crewai.shim import disable_acceleration
+    disable_acceleration()
+
+
 def main():
     """Run all tests."""
     print("\n")
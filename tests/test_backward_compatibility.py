@@ -5,327 +5,348 @@ These tests verify that existing CrewAI code continues to work unchanged
 when the Rust integration is installed.
 """
 
-import unittest
+import pytest
 import os
 import sys
-from typing import Any, Dict, List, Optional
-from unittest.mock import patch, MagicMock
-
-# Add the fast_crewai directory to the path for testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'fast_crewai'))
-
-try:
-    from fast_crewai import HAS_RUST_IMPLEMENTATION
-    RUST_AVAILABLE = HAS_RUST_IMPLEMENTATION
-except ImportError:
-    RUST_AVAILABLE = False
-
-class TestBackwardCompatibility(unittest.TestCase):
-    """Test backward compatibility with existing CrewAI code."""
-
-    def setUp(self):
-        """Set up test environment."""
-        # Clear any existing environment variables that might affect tests
-        self.original_env = {}
-        env_vars = [
-            'FAST_CREWAI_ACCELERATION',
-            'FAST_CREWAI_MEMORY',
-            'FAST_CREWAI_TOOLS',
-            'FAST_CREWAI_TASKS',
-            'FAST_CREWAI_SERIALIZATION',
-            'FAST_CREWAI_DATABASE'
-        ]
-        
-        for var in env_vars:
-            if var in os.environ:
-                self.original_env[var] = os.environ[var]
-                del os.environ[var]
-
-    def tearDown(self):
-        """Clean up test environment."""
-        # Restore original environment variables
-        for var, value in self.original_env.items():
-            os.environ[var] = value
-
-    def test_import_fast_crewai(self):
-        """Test that fast_crewai can be imported without errors."""
-        try:
-            import fast_crewai
-            self.assertTrue(hasattr(fast_crewai, '__version__'))
-            self.assertTrue(hasattr(fast_crewai, 'HAS_RUST_IMPLEMENTATION'))
-        except ImportError as e:
-            self.fail(f"Failed to import fast_crewai: {e}")
-
-    def test_rust_availability_flag(self):
-        """Test that HAS_RUST_IMPLEMENTATION is properly defined."""
-        import fast_crewai
-        self.assertIsInstance(fast_crewai.HAS_RUST_IMPLEMENTATION, bool)
-
-    def test_environment_variable_handling(self):
-        """Test that environment variables are handled correctly."""
-        # Test with environment variable set to 'true'
-        os.environ['FAST_CREWAI_ACCELERATION'] = '1'
-        
-        try:
-            # Re-import to test environment variable handling
-            import importlib
-            import fast_crewai
-            importlib.reload(fast_crewai)
-        except Exception as e:
-            # This is expected if Rust components aren't available
-            pass
-
-    def test_graceful_degradation(self):
-        """Test that the system gracefully degrades when Rust is unavailable."""
-        if not RUST_AVAILABLE:
-            # Test that components fall back to Python implementations
-            try:
-                from fast_crewai.memory import RustMemoryStorage
-                storage = RustMemoryStorage()
-                self.assertEqual(storage.implementation, "python")
-            except Exception as e:
-                # This is expected if Rust components aren't available
-                pass
-
-    def test_component_imports(self):
-        """Test that all components can be imported."""
-        components = [
-            'RustMemoryStorage',
-            'RustToolExecutor', 
-            'RustTaskExecutor',
-            'AgentMessage',
-            'RustSQLiteWrapper'
-        ]
-        
-        for component in components:
-            try:
-                from fast_crewai import component
-                self.assertTrue(True)  # Import successful
-            except ImportError:
-                # This is expected if Rust components aren't available
-                pass
-
-    def test_utility_functions(self):
-        """Test that utility functions work correctly."""
-        try:
-            from fast_crewai.utils import is_rust_available, get_rust_status
-            self.assertIsInstance(is_rust_available(), bool)
-            self.assertIsInstance(get_rust_status(), dict)
-        except ImportError:
-            # This is expected if Rust components aren't available
-            pass
-
-    def test_shim_import(self):
-        """Test that the shim module can be imported."""
-        try:
-            import fast_crewai.shim
-            self.assertTrue(hasattr(fast_crewai.shim, 'enable_rust_acceleration'))
-        except ImportError:
-            # This is expected if shim module isn't available
-            pass
-
-    def test_memory_storage_compatibility(self):
-        """Test that memory storage maintains API compatibility."""
-        try:
-            from fast_crewai.memory import RustMemoryStorage
-            
-            # Test basic functionality
-            storage = RustMemoryStorage()
-            
-            # Test save method
-            storage.save("test value", {"metadata": "test"})
-            
-            # Test search method
-            results = storage.search("test", limit=5)
-            self.assertIsInstance(results, list)
-            
-            # Test get_all method
-            all_items = storage.get_all()
-            self.assertIsInstance(all_items, list)
-            
-            # Test reset method
-            storage.reset()
-            
-        except Exception as e:
-            # This is expected if Rust components aren't available
-            pass
-
-    def test_tool_executor_compatibility(self):
-        """Test that tool executor maintains API compatibility."""
-        try:
-            from fast_crewai.tools import RustToolExecutor
-            
-            # Test basic functionality
-            executor = RustToolExecutor(max_recursion_depth=10)
-            
-            # Test execute_tool method
-            result = executor.execute_tool("test_tool", {"param": "value"})
-            self.assertIsInstance(result, str)
-            
-        except Exception as e:
-            # This is expected if Rust components aren't available
-            pass
-
-    def test_task_executor_compatibility(self):
-        """Test that task executor maintains API compatibility."""
-        try:
-            from fast_crewai.tasks import RustTaskExecutor
-            
-            # Test basic functionality
-            executor = RustTaskExecutor()
-            
-            # Test execute_concurrent_tasks method
-            tasks = ["task1", "task2", "task3"]
-            results = executor.execute_concurrent_tasks(tasks)
-            self.assertIsInstance(results, list)
-            self.assertEqual(len(results), len(tasks))
-            
-        except Exception as e:
-            # This is expected if Rust components aren't available
-            pass
-
-    def test_serialization_compatibility(self):
-        """Test that serialization maintains API compatibility."""
-        try:
-            from fast_crewai.serialization import AgentMessage
-            
-            # Test basic functionality
-            message = AgentMessage(
-                id="test_id",
-                sender="test_sender", 
-                recipient="test_recipient",
-                content="test_content",
-                timestamp=1234567890
-            )
-            
-            # Test to_json method
-            json_str = message.to_json()
-            self.assertIsInstance(json_str, str)
-            
-            # Test from_json method
-            message2 = AgentMessage.from_json(json_str)
-            self.assertEqual(message.id, message2.id)
-            self.assertEqual(message.sender, message2.sender)
-            
-        except Exception as e:
-            # This is expected if Rust components aren't available
-            pass
-
-    def test_database_compatibility(self):
-        """Test that database operations maintain API compatibility."""
-        try:
-            import tempfile
-            from fast_crewai.database import RustSQLiteWrapper
-            
-            # Test basic functionality
-            with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
-                db_path = tmp.name
-            
-            try:
-                wrapper = RustSQLiteWrapper(db_path)
-            
-                # Test execute_query method
-                results = wrapper.execute_query("SELECT 1 as test")
-                self.assertIsInstance(results, list)
-                
-                # Test execute_update method
-                affected = wrapper.execute_update("CREATE TABLE test (id INTEGER)")
-                self.assertIsInstance(affected, int)
-                
-            finally:
-                # Clean up
-                if os.path.exists(db_path):
-                    os.unlink(db_path)
-                    
-        except Exception as e:
-            # This is expected if Rust components aren't available
-            pass
-
-    def test_integration_with_crewai(self):
-        """Test integration with actual CrewAI components."""
-        try:
-            # Test that we can import CrewAI components
-            from crewai import Agent, Task, Crew
-            
-            # Create a simple agent
-            agent = Agent(
-                role="Test Agent",
-                goal="Test Goal",
-                backstory="Test Backstory"
-            )
-            
-            # Create a simple task
-            task = Task(
-                description="Test Task",
-                expected_output="Test Output",
-                agent=agent
-            )
-            
-            # Create a crew
-            crew = Crew(
-                agents=[agent],
-                tasks=[task]
-            )
-            
-            self.assertIsNotNone(crew)
-            
-        except ImportError:
-            # This is expected if CrewAI isn't installed
-            pass
-
-    def test_error_handling(self):
-        """Test that error handling works correctly."""
-        try:
-            from fast_crewai.memory import RustMemoryStorage
-            
-            # Test with invalid parameters
-            storage = RustMemoryStorage()
-            
-            # Test search with invalid parameters
-            results = storage.search("", limit=-1)
-            self.assertIsInstance(results, list)
-            
-        except Exception as e:
-            # This is expected if Rust components aren't available
-            pass
-
-    def test_configuration_utilities(self):
-        """Test configuration utilities."""
-        try:
-            from fast_crewai.utils import configure_rust_components, get_environment_info
-            
-            # Test configure_rust_components
-            configure_rust_components(memory=True, tools=False)
-            
-            # Test get_environment_info
-            env_info = get_environment_info()
-            self.assertIsInstance(env_info, dict)
-            self.assertIn('FAST_CREWAI_MEMORY', env_info)
-            
-        except ImportError:
-            # This is expected if Rust components aren't available
-            pass
-
-    def test_performance_utilities(self):
-        """Test performance utilities."""
-        try:
-            from fast_crewai.utils import get_performance_improvements, benchmark_comparison
-            
-            # Test get_performance_improvements
-            improvements = get_performance_improvements()
-            self.assertIsInstance(improvements, dict)
-            self.assertIn('memory', improvements)
-            
-            # Test benchmark_comparison
-            memory_benchmark = benchmark_comparison('memory')
-            self.assertIsInstance(memory_benchmark, dict)
-            
-        except ImportError:
-            # This is expected if Rust components aren't available
-            pass
-
-
-if __name__ == '__main__':
-    unittest.main()
+import asyncio
+import importlib
+import subprocess
 
+from fast_crewai import HAS_ACCELERATION_IMPLEMENTATION
 
+requires_extension = pytest.mark.skipif(
+    not HAS_ACCELERATION_IMPLEMENTATION, reason="Rust extension not built"
+)
+
+_ENV_VARS = (
+    'FAST_CREWAI_ACCELERATION',
+    'FAST_CREWAI_MEMORY',
+    'FAST_CREWAI_TOOLS',
+    'FAST_CREWAI_TASKS',
+    'FAST_CREWAI_SERIALIZATION',
+    'FAST_CREWAI_DATABASE',
+)
+
+
+@pytest.fixture(scope="module")
+def shared_db(tmp_path_factory):
+    """One SQLite file for every database test in this module."""
+    return str(tmp_path_factory.mktemp("db") / "test.db")
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    """Clear environment variables that might affect tests."""
+    for var in _ENV_VARS:
+        # setenv first so monkeypatch also undoes values set by the test itself
+        monkeypatch.setenv(var, "")
+        monkeypatch.delenv(var)
+
+
+@pytest.mark.parametrize("attr, type_", [
+    ('__version__', str),
+    ('HAS_ACCELERATION_IMPLEMENTATION', bool),
+])
+def test_package_attribute(fast_crewai_mod, attr, type_):
+    """Test that the package exposes its version and acceleration flag."""
+    assert isinstance(getattr(fast_crewai_mod, attr), type_)
+
+
+def test_environment_variable_handling():
+    """Test that environment variables are handled correctly."""
+    # Import in a fresh interpreter; reloading would not re-run the extension
+    code = (
+        "import os; assert os.environ.get('FAST_CREWAI_ACCELERATION') == '1'; "
+        "import fast_crewai; print(fast_crewai.HAS_ACCELERATION_IMPLEMENTATION)"
+    )
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, FAST_CREWAI_ACCELERATION='1', PYTHONPATH=project_root)
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        env=env, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == str(HAS_ACCELERATION_IMPLEMENTATION)
+
+
+@pytest.mark.skipif(HAS_ACCELERATION_IMPLEMENTATION, reason="Rust extension is built")
+def test_graceful_degradation():
+    """Test that the system gracefully degrades when Rust is unavailable."""
+    from fast_crewai.memory import AcceleratedMemoryStorage
+    storage = AcceleratedMemoryStorage()
+    assert storage.implementation == "python"
+
+
+@pytest.mark.parametrize("component", [
+    'AcceleratedMemoryStorage',
+    'AcceleratedToolExecutor',
+    'AcceleratedTaskExecutor',
+    'AgentMessage',
+    'AcceleratedSQLiteWrapper',
+])
+def test_component_importable(component):
+    """Test that each component is exported by the package."""
+    package = importlib.import_module('fast_crewai')
+    assert getattr(package, component) is not None
+
+
+def test_utility_functions():
+    """Test that utility functions work correctly."""
+    from fast_crewai.utils import is_acceleration_available, get_acceleration_status
+    assert isinstance(is_acceleration_available(), bool)
+    assert isinstance(get_acceleration_status(), dict)
+
+
+def test_shim_import():
+    """Test that the shim module can be imported."""
+    import fast_crewai.shim
+    assert hasattr(fast_crewai.shim, 'enable_acceleration')
+    assert hasattr(fast_crewai.shim, 'disable_acceleration')
+
+
+def _smoke_memory_storage(cls, db_path):
+    storage = cls()
+    storage.save("test value", {"metadata": "test"})
+    assert isinstance(storage.search("test", limit=5), list)
+    assert isinstance(storage.get_all(), list)
+    storage.reset()
+
+
+def _smoke_tool_executor(cls, db_path):
+    executor = cls(max_recursion_depth=10)
+    result = executor.execute_tool("test_tool", {"param": "value"})
+    assert isinstance(result, str)
+
+
+def _smoke_task_executor(cls, db_path):
+    executor = cls()
+    results = [asyncio.run(executor.execute_task(str, task))
+               for task in ("task1", "task2", "task3")]
+    assert results == ["task1", "task2", "task3"]
+
+
+def _smoke_serialization(cls, db_path):
+    message = cls(
+        id="test_id",
+        sender="test_sender",
+        recipient="test_recipient",
+        content="test_content",
+        timestamp=1234567890
+    )
+    message2 = cls.from_json(message.to_json())
+    assert message.id == message2.id
+    assert message.sender == message2.sender
+
+
+def _smoke_database(cls, db_path):
+    wrapper = cls(db_path)
+    assert isinstance(wrapper.execute_query("SELECT 1 as test"), list)
+    # Each call runs on its own connection, so a savepoint would not outlive
+    # the statement; drop the table instead to leave the shared file clean.
+    assert isinstance(wrapper.execute_update("CREATE TABLE test (id INTEGER)"), int)
+    wrapper.execute_update("DROP TABLE test")
+
+
+@pytest.mark.parametrize("module, cls, smoke_fn", [
+    ('fast_crewai.memory', 'AcceleratedMemoryStorage', _smoke_memory_storage),
+    ('fast_crewai.tools', 'AcceleratedToolExecutor', _smoke_tool_executor),
+    ('fast_crewai.tasks', 'AcceleratedTaskExecutor', _smoke_task_executor),
+    ('fast_crewai.serialization', 'AgentMessage', _smoke_serialization),
+    ('fast_crewai.database', 'AcceleratedSQLiteWrapper', _smoke_database),
+], ids=['memory', 'tools', 'tasks', 'serialization', 'database'])
+def test_api_compatibility(module, cls, smoke_fn, shared_db):
+    """Test that each component keeps the API CrewAI code relies on."""
+    smoke_fn(getattr(importlib.import_module(module), cls), shared_db)
+
+
+def test_ltm_storage_round_trip(tmp_path):
+    """Test the LTMSQLiteStorage interface of its replacement."""
+    from fast_crewai.database import AcceleratedLTMSQLiteStorage
+
+    storage = AcceleratedLTMSQLiteStorage(str(tmp_path / "ltm.db"))
+    storage.save("write report", {"quality": 8}, "2024-01-01T00:00:00", 0.9)
+
+    assert storage.load("write report") == [
+        {'metadata': {"quality": 8}, 'datetime': "2024-01-01T00:00:00", 'score': 0.9}
+    ]
+    storage.reset()
+    assert storage.load("write report") is None
+
+
+def test_kickoff_storage_round_trip(tmp_path):
+    """Test the KickoffTaskOutputsSQLiteStorage interface of its replacement."""
+    from types import SimpleNamespace
+    from fast_crewai.database import AcceleratedKickoffTaskOutputsSQLiteStorage
+
+    storage = AcceleratedKickoffTaskOutputsSQLiteStorage(str(tmp_path / "kickoff.db"))
+    task = SimpleNamespace(id="task-1", key="key-1", expected_output="A report")
+    storage.add(task, {"raw": "draft"}, 0, inputs={"topic": "AI"})
+    storage.update(0, output={"raw": "final"}, was_replayed=True)
+
+    [row] = storage.load()
+    assert (row['task_id'], row['output'], row['inputs'], row['was_replayed']) == (
+        "task-1", {"raw": "final"}, {"topic": "AI"}, 1
+    )
+    storage.delete_all()
+    assert storage.load() == []
+
+
+def test_batch_new():
+    """Test creating several messages at once."""
+    from fast_crewai.serialization import AgentMessage
+    records = [
+        ("1", "agent1", "agent2", "Hello", 1000000),
+        ("2", "agent2", "agent1", "Hi", 1000001)
+    ]
+
+    messages = AgentMessage.batch_new(records)
+    assert [m.id for m in messages] == ["1", "2"]
+    assert messages[1].content == "Hi"
+    assert AgentMessage.from_json(messages[1].to_json()).timestamp == 1000001
+
+
+def test_columnar_batch_serialization():
+    """Test batch serialization from parallel columns."""
+    from fast_crewai.serialization import RustSerializer
+    serializer = RustSerializer()
+
+    serialized = serializer.serialize_batch(
+        ids=["1", "2"],
+        senders=["agent1", "agent2"],
+        recipients=["agent2", "agent1"],
+        contents=["Hello", "Hi"],
+        timestamps=[1000000, 1000001]
+    )
+    assert len(serialized) == 2
+
+    deserialized = serializer.deserialize_batch(serialized)
+    assert deserialized[1]["sender"] == "agent2"
+    assert deserialized[1]["timestamp"] == 1000001
+
+    with pytest.raises(ValueError):
+        serializer.serialize_batch(ids=["1"], senders=[], recipients=[],
+                                   contents=[], timestamps=[])
+    with pytest.raises(ValueError, match="not both"):
+        serializer.serialize_batch([{"id": "1"}], ids=["2"])
+
+
+def test_columnar_batch_fallback_is_per_call(monkeypatch):
+    """Test that a failed backend batch only moves that batch to Python."""
+    from fast_crewai import serialization
+
+    class FakeMessage:
+        @staticmethod
+        def serialize_columns(ids, senders, recipients, contents, timestamps):
+            if "bad" in contents:
+                raise TypeError("bad column value")
+            return ["from backend"] * len(ids)
+
+    monkeypatch.setattr(serialization, "_RUST_AVAILABLE", True)
+    monkeypatch.setattr(serialization, "_AgentMessage", FakeMessage, raising=False)
+    serializer = serialization.RustSerializer()
+
+    def batch(content):
+        return serializer.serialize_batch(ids=["1"], senders=["a"], recipients=["b"],
+                                          contents=[content], timestamps=[1])
+
+    assert batch("bad") != ["from backend"]
+    assert batch("good") == ["from backend"]
+
+
+def test_serialization_batch_round_trip():
+    """Test that messages survive a batched JSON round trip."""
+    from fast_crewai.serialization import AgentMessage
+
+    messages = AgentMessage.batch_new(
+        (str(i), "sender", "recipient", f"content {i}", 1234567890 + i)
+        for i in range(1000)
+    )
+    json_strs = AgentMessage.to_json_batch(messages)
+    assert json_strs == [message.to_json() for message in messages]
+
+    restored = AgentMessage.from_json_batch(json_strs)
+    assert [m.id for m in restored] == [m.id for m in messages]
+    assert restored[-1].timestamp == 1234567890 + 999
+
+
+@pytest.mark.slow
+def test_integration_with_crewai():
+    """Test integration with actual CrewAI components."""
+    crewai = pytest.importorskip("crewai")
+
+    # Create a simple agent
+    agent = crewai.Agent(
+        role="Test Agent",
+        goal="Test Goal",
+        backstory="Test Backstory"
+    )
+
+    # Create a simple task
+    task = crewai.Task(
+        description="Test Task",
+        expected_output="Test Output",
+        agent=agent
+    )
+
+    # Create a crew
+    crew = crewai.Crew(
+        agents=[agent],
+        tasks=[task]
+    )
+
+    assert crew is not None
+
+
+def test_error_handling():
+    """Test that error handling works correctly."""
+    from fast_crewai.memory import AcceleratedMemoryStorage
+
+    storage = AcceleratedMemoryStorage()
+
+    # Test search with invalid parameters
+    results = storage.search("", limit=-1)
+    assert isinstance(results, list)
+
+
+def test_configuration_utilities():
+    """Test configuration utilities."""
+    from fast_crewai.utils import configure_accelerated_components, get_environment_info
+
+    configure_accelerated_components(memory=True, tools=False)
+
+    env_info = get_environment_info()
+    assert env_info['FAST_CREWAI_MEMORY'] == 'true'
+    assert env_info['FAST_CREWAI_TOOLS'] == 'false'
+
+
+def test_performance_utilities():
+    """Test performance utilities."""
+    from fast_crewai.utils import get_performance_improvements, benchmark_comparison
+
+    improvements = get_performance_improvements()
+    assert isinstance(improvements, dict)
+    assert 'memory' in improvements
+
+    memory_benchmark = benchmark_comparison('memory')
+    assert isinstance(memory_benchmark, dict)
+
+
+@pytest.fixture(scope="module")
+def core():
+    """The compiled extension module."""
+    return pytest.importorskip("fast_crewai._core")
+
+
+@requires_extension
+class TestAccelerationAvailable:
+    """Tests that only make sense when the Rust extension is built."""
+
+    @pytest.mark.parametrize("module, cls", [
+        ('fast_crewai.memory', 'AcceleratedMemoryStorage'),
+        ('fast_crewai.tools', 'AcceleratedToolExecutor'),
+        ('fast_crewai.tasks', 'AcceleratedTaskExecutor'),
+    ], ids=['memory', 'tools', 'tasks'])
+    def test_components_default_to_extension(self, core, module, cls):
+        """Test that components pick the extension when it is available."""
+        component = getattr(importlib.import_module(module), cls)()
+        assert component.implementation == "rust"
@@ -25,7 +25,8 @@ print()
 # Step 1: Activate the shim BEFORE importing CrewAI
 print("Step 1: Activating Fast-CrewAI shim...")
 try:
-    import fast_crewai.shim
+    import fast_crewai
+    fast_crewai.install()
     print("✅ Shim activated successfully\n")
 except Exception as e:
     print(f"❌ Failed to activate shim: {e}")
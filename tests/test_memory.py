@@ -67,7 +67,7 @@ class TestAcceleratedMemoryStorage:
 
         assert len(results) >= 0  # Should not crash
 
-    def test_memory_performance_basic(self):
+    def test_memory_performance_basic(self, no_gc):
         """Basic performance test for memory operations."""
         from fast_crewai import AcceleratedMemoryStorage
 
@@ -76,16 +76,16 @@ class TestAcceleratedMemoryStorage:
         # Test save performance
         documents = [f"Document {i}" for i in range(100)]
 
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         for doc in documents:
             storage.save(doc, {"id": documents.index(doc)})
-        save_time = time.time() - start_time
+        save_time = (time.perf_counter_ns() - start_time) / 1e9
 
         # Test search performance
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         for i in range(10):
             results = storage.search("Document", limit=5)
-        search_time = time.time() - start_time
+        search_time = (time.perf_counter_ns() - start_time) / 1e9
 
         # Performance should be reasonable (not testing specific speeds)
         assert save_time < 10.0  # Should save 100 docs in under 10 seconds
@@ -104,17 +104,41 @@ class TestAcceleratedMemoryStorage:
         results = storage.search("fallback", limit=1)
         assert isinstance(results, list)
 
+    @pytest.mark.parametrize("name, args, kwargs, expected_type", [
+        ("AcceleratedRAGStorage", ("documents",), {"allow_reset": True}, "documents"),
+        ("AcceleratedShortTermMemory", (), {"crew": None, "embedder_config": {}}, "short_term"),
+        ("AcceleratedMemory", (None,), {}, "memory"),
+        ("AcceleratedLongTermMemory", (), {"path": "ltm.db"}, "long_term"),
+        ("AcceleratedEntityMemory", (), {"crew": None}, "entities"),
+    ])
+    def test_per_target_memory_classes(self, name, args, kwargs, expected_type):
+        """Test that each replacement accepts its target's constructor arguments."""
+        from fast_crewai import memory
+
+        storage = getattr(memory, name)(*args, **kwargs)
+        assert isinstance(storage, memory.AcceleratedMemoryStorage)
+        assert storage.type == expected_type
+
+        storage.save("per-target document", {"class": name})
+        assert isinstance(storage.search("document", limit=1), list)
+
+    def test_per_target_memory_rejects_unknown_arguments(self):
+        """Test that replacements reject arguments the replaced class doesn't take."""
+        from fast_crewai import memory
+
+        with pytest.raises(TypeError, match="unexpected keyword argument 'crew'"):
+            memory.AcceleratedMemory(crew=None)
+        with pytest.raises(TypeError, match="multiple values for argument 'storage'"):
+            memory.AcceleratedLongTermMemory(None, storage=None)
+
 
 class TestMemoryIntegration:
     """Integration tests for memory components with CrewAI."""
 
-    def test_crewai_memory_import_compatibility(self):
+    def test_crewai_memory_import_compatibility(self, accelerated):
         """Test that CrewAI memory imports work after shimming."""
         try:
-            # Import shim first
-            import fast_crewai.shim
-
-            # Then try to import CrewAI memory components
+            # Import CrewAI memory components
             from crewai.memory.storage.rag_storage import RAGStorage
             from crewai.memory.short_term.short_term_memory import ShortTermMemory
             from crewai.memory.long_term.long_term_memory import LongTermMemory
@@ -125,10 +149,9 @@ class TestMemoryIntegration:
             # CrewAI might not be installed in test environment
             pytest.skip("CrewAI not available for integration testing")
 
-    def test_memory_component_replacement(self):
+    def test_memory_component_replacement(self, accelerated):
         """Test that memory components are properly replaced by shim."""
         try:
-            import fast_crewai.shim
             from crewai.memory.storage.rag_storage import RAGStorage
 
             # Try to create storage - should use Rust implementation if available
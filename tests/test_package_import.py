@@ -2,28 +2,23 @@
 Tests for basic package imports and availability.
 """
 
+import sys
+import types
+
 import pytest
 
 
 class TestPackageImport:
     """Test basic package import functionality."""
 
-    def test_import_fast_crewai(self):
-        """Test that we can import the main package."""
-        import fast_crewai
-        assert fast_crewai is not None
-
-    def test_package_version(self):
-        """Test that package has version information."""
+    @pytest.mark.parametrize("attr, type_", [
+        ('__version__', str),
+        ('HAS_ACCELERATION_IMPLEMENTATION', bool),
+    ])
+    def test_package_attribute(self, attr, type_):
+        """Test that the package exposes its version and acceleration flag."""
         import fast_crewai
-        assert hasattr(fast_crewai, '__version__')
-        assert isinstance(fast_crewai.__version__, str)
-
-    def test_acceleration_implementation_flag(self):
-        """Test that package has acceleration implementation flag."""
-        import fast_crewai
-        assert hasattr(fast_crewai, 'HAS_ACCELERATION_IMPLEMENTATION')
-        assert isinstance(fast_crewai.HAS_ACCELERATION_IMPLEMENTATION, bool)
+        assert isinstance(getattr(fast_crewai, attr), type_)
 
     def test_acceleration_availability_functions(self):
         """Test acceleration availability detection functions."""
@@ -50,60 +45,39 @@ class TestPackageImport:
 
     def test_serialization_imports(self):
         """Test that we can import serialization components."""
-        try:
-            from fast_crewai import AcceleratedMessage
-            assert AcceleratedMessage is not None
-        except ImportError:
-            # Serialization components might not be available
-            pass
+        serialization = pytest.importorskip("fast_crewai.serialization")
+        assert getattr(serialization, "AgentMessage", None) is not None
 
     def test_database_imports(self):
         """Test that we can import database components."""
-        try:
-            from fast_crewai import AcceleratedSQLiteWrapper
-            assert AcceleratedSQLiteWrapper is not None
-        except ImportError:
-            # Database components might not be available
-            pass
+        database = pytest.importorskip("fast_crewai.database")
+        assert getattr(database, "AcceleratedSQLiteWrapper", None) is not None
 
 
 class TestComponentAvailability:
     """Test availability of different components."""
 
-    def test_memory_component_creation(self):
+    def test_memory_component_creation(self, memory_storage):
         """Test that memory components can be created."""
-        from fast_crewai import RustMemoryStorage
-
-        storage = RustMemoryStorage()
-        assert storage is not None
-        assert hasattr(storage, 'implementation')
+        assert memory_storage is not None
+        assert hasattr(memory_storage, 'implementation')
 
-    def test_tool_component_creation(self):
+    def test_tool_component_creation(self, tool_executor):
         """Test that tool components can be created."""
-        from fast_crewai import RustToolExecutor
+        assert tool_executor is not None
 
-        executor = RustToolExecutor()
-        assert executor is not None
-
-    def test_task_component_creation(self):
+    def test_task_component_creation(self, task_executor):
         """Test that task components can be created."""
-        from fast_crewai import RustTaskExecutor
-
-        executor = RustTaskExecutor()
-        assert executor is not None
+        assert task_executor is not None
 
-    def test_component_methods_exist(self):
+    def test_component_methods_exist(self, memory_storage, tool_executor):
         """Test that components have expected methods."""
-        from fast_crewai import RustMemoryStorage, RustToolExecutor
-
         # Memory storage methods
-        storage = RustMemoryStorage()
-        assert hasattr(storage, 'save')
-        assert hasattr(storage, 'search')
+        assert hasattr(memory_storage, 'save')
+        assert hasattr(memory_storage, 'search')
 
         # Tool executor methods
-        executor = RustToolExecutor()
-        assert hasattr(executor, 'execute_tool')
+        assert hasattr(tool_executor, 'execute_tool')
 
 
 class TestEnvironmentInfo:
@@ -129,6 +103,48 @@ class TestEnvironmentInfo:
             # Function might not be implemented
             pass
 
+    def test_component_probe_uses_extension_names(self, monkeypatch):
+        """Test that the probe looks for the classes the extension registers."""
+        from fast_crewai import utils
+
+        core = types.ModuleType("fast_crewai._core")
+        for name in ("RustMemoryStorage", "RustToolExecutor", "RustTaskExecutor",
+                     "AgentMessage", "RustSQLiteWrapper"):
+            setattr(core, name, type(name, (), {}))
+        monkeypatch.setitem(sys.modules, "fast_crewai._core", core)
+
+        assert all(available for _, available in utils._probe_components())
+
+    def test_backends_use_extension_names(self):
+        """Test that every backend picks up the classes the extension registers."""
+        import os
+        import subprocess
+
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = (
+            "import sys, types\n"
+            "core = types.ModuleType('fast_crewai._core')\n"
+            "for name in ('RustMemoryStorage', 'RustToolExecutor', 'RustTaskExecutor',\n"
+            "             'AgentMessage', 'RustSQLiteWrapper'):\n"
+            "    setattr(core, name, type(name, (), {}))\n"
+            "sys.modules['fast_crewai._core'] = core\n"
+            "from fast_crewai import memory, tools, tasks, serialization, database\n"
+            "sys.exit(0 if all(m._RUST_AVAILABLE for m in\n"
+            "                  (memory, tools, tasks, serialization, database)) else 1)\n"
+        )
+
+        env = dict(os.environ, PYTHONPATH=project_root)
+        result = subprocess.run([sys.executable, '-c', code], env=env, timeout=60)
+        assert result.returncode == 0
+
+    def test_acceleration_status_is_cached(self):
+        """Test that the extension is probed once per process."""
+        from fast_crewai import is_acceleration_available, get_acceleration_status
+
+        assert is_acceleration_available() is is_acceleration_available()
+        assert is_acceleration_available.cache_info().currsize == 1
+        assert get_acceleration_status() is get_acceleration_status()
+
     def test_rust_status_details(self):
         """Test detailed Rust status information."""
         from fast_crewai import get_rust_status
@@ -136,7 +152,3 @@ class TestEnvironmentInfo:
         status = get_rust_status()
         assert isinstance(status, str)
         assert len(status) > 0
-
-
-if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
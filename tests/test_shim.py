@@ -5,9 +5,32 @@ Tests for the shim system that enables Rust acceleration.
 import pytest
 import os
 import sys
+import types
 from unittest.mock import patch
 
 
+@pytest.fixture
+def stub_crewai(tmp_path, monkeypatch):
+    """
+    Put an empty ``crewai`` package first on sys.path.
+
+    Any CrewAI modules already imported are hidden for the duration of the
+    test and acceleration is disabled afterwards.
+    """
+    (tmp_path / "crewai").mkdir()
+    (tmp_path / "crewai" / "__init__.py").write_text("")
+    for name in [name for name in sys.modules if name.split('.')[0] == 'crewai']:
+        monkeypatch.delitem(sys.modules, name)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    yield tmp_path / "crewai"
+
+    from fast_crewai import shim
+    shim.disable_acceleration()
+    for name in [name for name in sys.modules if name.split('.')[0] == 'crewai']:
+        del sys.modules[name]
+
+
 class TestShimImport:
     """Test shim module import functionality."""
 
@@ -107,6 +130,41 @@ class TestEnvironmentVariableActivation:
             else:
                 os.environ['FAST_CREWAI_ACCELERATION'] = original
 
+    @pytest.mark.parametrize("module, patched", [
+        ("fast_crewai.shim", False),
+        ("fast_crewai._bootstrap", True),
+    ], ids=["shim", "bootstrap"])
+    def test_import_side_effects(self, module, patched, tmp_path):
+        """Test that only the bootstrap module patches CrewAI on import."""
+        import subprocess
+
+        # An empty stand-in, so the test doesn't depend on CrewAI being installed
+        (tmp_path / "crewai").mkdir()
+        (tmp_path / "crewai" / "__init__.py").write_text("")
+
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([project_root, str(tmp_path)]))
+        env.pop('FAST_CREWAI_ACCELERATION', None)
+        code = (
+            f"import sys, {module}; import fast_crewai.shim as shim; "
+            "sys.exit(0 if shim._finder in sys.meta_path else 1)"
+        )
+
+        result = subprocess.run([sys.executable, '-c', code], env=env, timeout=60)
+        assert result.returncode == (0 if patched else 1)
+
+    def test_enable_when_target_missing(self, monkeypatch):
+        """Test that nothing is deferred when CrewAI is not installed."""
+        import importlib.util
+        from fast_crewai import shim
+
+        monkeypatch.delitem(sys.modules, "crewai", raising=False)
+        monkeypatch.setattr(importlib.util, "find_spec", lambda name, *args: None)
+
+        assert shim.enable_acceleration() is False
+        assert shim._finder not in sys.meta_path
+        assert not shim._pending_patches
+
 
 class TestCrewAICompatibility:
     """Test shim compatibility with CrewAI components."""
@@ -190,14 +248,18 @@ class TestCrewAICompatibility:
 class TestShimInternals:
     """Test internal shim mechanisms."""
 
-    def test_monkey_patch_function_exists(self):
-        """Test that internal monkey patch function exists."""
-        try:
-            from fast_crewai.shim import _monkey_patch_class
-            assert callable(_monkey_patch_class)
-        except ImportError:
-            # Internal function might not be exposed
-            pass
+    def test_patch_function_exists(self):
+        """Test that internal patch function exists."""
+        from fast_crewai.shim import _patch_module
+        assert callable(_patch_module)
+
+    def test_each_target_has_own_accelerator(self):
+        """Test that no accelerated class replaces more than one CrewAI class."""
+        from fast_crewai.shim import _PATCH_TABLE
+
+        accelerators = [accelerator for patches in _PATCH_TABLE.values()
+                        for _, _, accelerator in patches]
+        assert len(accelerators) == len(set(accelerators))
 
     def test_original_classes_backup(self):
         """Test that original classes are backed up."""
@@ -240,6 +302,173 @@ class TestShimInternals:
         result = enable_rust_acceleration()
         assert isinstance(result, (int, type(None)))
 
+    def test_profile_path_writes_csv(self, tmp_path, monkeypatch, stub_crewai):
+        """Test that import timings are saved when a profile path is set."""
+        from fast_crewai import shim
+
+        profile_path = tmp_path / "timings.csv"
+        monkeypatch.setenv("FAST_CREWAI_PROFILE_PATH", str(profile_path))
+        monkeypatch.setattr(shim, "_profiling", False)
+        monkeypatch.setattr(shim, "_patch_timings", {"crewai.task": 0.5})
+
+        shim.enable_acceleration()
+
+        rows = profile_path.read_text().splitlines()
+        assert rows[0] == "module,seconds"
+        assert rows[1] == "crewai.task,0.5"
+
+    def test_profile_records_deferred_imports(self, tmp_path, monkeypatch, stub_crewai):
+        """Test that importing a deferred target adds its real import time."""
+        from fast_crewai import shim
+
+        (stub_crewai / "task.py").write_text("class Task:\n    pass\n")
+        profile_path = tmp_path / "timings.csv"
+        monkeypatch.setenv("FAST_CREWAI_PROFILE_PATH", str(profile_path))
+        monkeypatch.setattr(shim, "_patch_timings", {})
+        monkeypatch.setattr(shim, "_reported_timings", set())
+
+        assert shim.enable_acceleration()
+        assert profile_path.read_text().splitlines() == ["module,seconds"]
+
+        import crewai.task
+        crewai.task.Task  # Runs the lazily loaded module body
+
+        rows = dict(row.split(",") for row in profile_path.read_text().splitlines()[1:])
+        assert float(rows["crewai.task"]) > 0
+
+    def test_unwritable_profile_path(self, tmp_path, monkeypatch, stub_crewai):
+        """Test that a profile path that can't be written doesn't break imports."""
+        from fast_crewai import shim
+
+        (stub_crewai / "task.py").write_text("class Task:\n    pass\n")
+        profile_path = tmp_path / "missing" / "timings.csv"
+        monkeypatch.setenv("FAST_CREWAI_PROFILE_PATH", str(profile_path))
+        monkeypatch.setattr(shim, "_patch_timings", {})
+        monkeypatch.setattr(shim, "_reported_timings", set())
+
+        assert shim.enable_acceleration()
+
+        import crewai.task
+        crewai.task.Task  # Runs the lazily loaded module body
+        assert not profile_path.exists()
+
+
+class TestDeferredPatching:
+    """Test that patches for not-yet-imported modules are applied on import."""
+
+    def test_patch_applied_on_first_import(self, tmp_path, monkeypatch):
+        """Test that a deferred patch lands when the target module is imported."""
+        from fast_crewai import shim
+
+        (tmp_path / "deferred_target.py").write_text("class Original:\n    pass\n")
+        (tmp_path / "deferred_replacement.py").write_text("class Replacement:\n    pass\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        try:
+            shim._defer_patches(
+                "deferred_target", [("Original", "deferred_replacement:Replacement")]
+            )
+            assert "deferred_target" in shim._pending_patches
+            assert "deferred_target" not in sys.modules
+
+            import deferred_target
+            import deferred_replacement
+            assert deferred_target.Original is deferred_replacement.Replacement
+            assert "deferred_target" not in shim._pending_patches
+        finally:
+            shim._pending_patches.pop("deferred_target", None)
+            shim._original_classes.pop(("deferred_target", "Original"), None)
+            sys.modules.pop("deferred_target", None)
+            sys.modules.pop("deferred_replacement", None)
+            shim._resolve.cache_clear()
+            if shim._finder in sys.meta_path:
+                sys.meta_path.remove(shim._finder)
+
+    def test_concurrent_imports_are_patched(self, tmp_path, monkeypatch):
+        """Test that targets imported by two threads at once are both patched."""
+        import importlib
+        import threading
+        import time
+        from fast_crewai import shim
+
+        names = ("deferred_target_a", "deferred_target_b")
+        for name in names:
+            (tmp_path / f"{name}.py").write_text("class Original:\n    pass\n")
+            # A slow accelerator import keeps the first thread busy patching
+            (tmp_path / f"{name}_replacement.py").write_text(
+                "import time\ntime.sleep(0.2)\nclass Replacement:\n    pass\n"
+            )
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        seen = {}
+
+        def import_target(name):
+            seen[name] = importlib.import_module(name).Original
+
+        try:
+            for name in names:
+                shim._defer_patches(name, [("Original", f"{name}_replacement:Replacement")])
+
+            threads = [threading.Thread(target=import_target, args=(name,)) for name in names]
+            threads[0].start()
+            time.sleep(0.05)
+            threads[1].start()
+            for thread in threads:
+                thread.join(timeout=10)
+
+            for name in names:
+                assert seen[name] is sys.modules[f"{name}_replacement"].Replacement
+        finally:
+            for name in names:
+                shim._pending_patches.pop(name, None)
+                shim._original_classes.pop((name, "Original"), None)
+                sys.modules.pop(name, None)
+                sys.modules.pop(f"{name}_replacement", None)
+            shim._resolve.cache_clear()
+            if shim._finder in sys.meta_path:
+                sys.meta_path.remove(shim._finder)
+
+
+class TestDisableAcceleration:
+    """Test that disabling only restores our own replacements."""
+
+    def _patched_module(self, monkeypatch):
+        from fast_crewai import shim
+
+        module = types.ModuleType("restore_target")
+        module.Target = type("Original", (), {})
+        replacement = types.ModuleType("restore_replacement")
+        replacement.Accelerated = type("Accelerated", (), {})
+        monkeypatch.setitem(sys.modules, "restore_target", module)
+        monkeypatch.setitem(sys.modules, "restore_replacement", replacement)
+        original = module.Target
+        assert shim._patch_module(
+            "restore_target", [("Target", "restore_replacement:Accelerated")]
+        ) == 1
+        return module, original
+
+    def test_disable_restores_original(self, monkeypatch):
+        """Test that a patched class is restored, and a second call is a no-op."""
+        from fast_crewai import shim
+
+        module, original = self._patched_module(monkeypatch)
+
+        assert shim.disable_acceleration()
+        assert module.Target is original
+        assert shim.disable_acceleration()
+        assert module.Target is original
+
+    def test_disable_keeps_third_party_patch(self, monkeypatch):
+        """Test that a class patched over ours by someone else is left alone."""
+        from fast_crewai import shim
+
+        module, _ = self._patched_module(monkeypatch)
+        third_party = type("ThirdParty", (module.Target,), {})
+        module.Target = third_party
+
+        assert shim.disable_acceleration()
+        assert module.Target is third_party
+
 
 class TestShimErrorHandling:
     """Test error handling in shim system."""
@@ -88,13 +88,10 @@ class TestRustTaskExecutor:
 class TestTaskIntegration:
     """Integration tests for task components with CrewAI."""
 
-    def test_crewai_task_import_compatibility(self):
+    def test_crewai_task_import_compatibility(self, accelerated):
         """Test that CrewAI task imports work after shimming."""
         try:
-            # Import shim first
-            import fast_crewai.shim
-
-            # Then try to import CrewAI task components
+            # Import CrewAI task components
             from crewai.task import Task
             from crewai.crew import Crew
 
@@ -104,10 +101,9 @@ class TestTaskIntegration:
             # CrewAI might not be installed in test environment
             pytest.skip("CrewAI not available for integration testing")
 
-    def test_task_shimming_behavior(self):
+    def test_task_shimming_behavior(self, accelerated):
         """Test that task components are properly shimmed."""
         try:
-            import fast_crewai.shim
             from crewai.task import Task
 
             # Should be able to use Task class
@@ -118,10 +114,9 @@ class TestTaskIntegration:
         except ImportError:
             pytest.skip("CrewAI not available for integration testing")
 
-    def test_crew_integration(self):
+    def test_crew_integration(self, accelerated):
         """Test integration with CrewAI Crew class."""
         try:
-            import fast_crewai.shim
             from crewai import Agent, Task, Crew
 
             # Create minimal crew for testing
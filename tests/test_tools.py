@@ -87,13 +87,10 @@ class TestRustToolExecutor:
 class TestToolIntegration:
     """Integration tests for tool components with CrewAI."""
 
-    def test_crewai_tool_import_compatibility(self):
+    def test_crewai_tool_import_compatibility(self, accelerated):
         """Test that CrewAI tool imports work after shimming."""
         try:
-            # Import shim first
-            import fast_crewai.shim
-
-            # Then try to import CrewAI tool components
+            # Import CrewAI tool components
             from crewai.tools.base_tool import BaseTool
             from crewai.tools.structured_tool import CrewStructuredTool
 
@@ -103,10 +100,9 @@ class TestToolIntegration:
             # CrewAI might not be installed in test environment
             pytest.skip("CrewAI not available for integration testing")
 
-    def test_tool_decorator_integration(self):
+    def test_tool_decorator_integration(self, accelerated):
         """Test integration with CrewAI tool decorator."""
         try:
-            import fast_crewai.shim
             from crewai import tool
 
             @tool
@@ -120,10 +116,9 @@ class TestToolIntegration:
         except ImportError:
             pytest.skip("CrewAI not available for integration testing")
 
-    def test_tool_shimming_behavior(self):
+    def test_tool_shimming_behavior(self, accelerated):
         """Test that tool components are properly shimmed."""
         try:
-            import fast_crewai.shim
             from crewai.tools.structured_tool import CrewStructuredTool
 
             # Should be able to use CrewStructuredTool
@@ -185,6 +180,66 @@ class TestToolEdgeCases:
 
         assert executor is not None
 
+    def test_tool_batch_execution(self):
+        """Test executing several tools in one batch call."""
+        from fast_crewai import AcceleratedToolExecutor
+
+        executor = AcceleratedToolExecutor()
+        calls = [("calculator", {"a": 1}), ("search", "query")]
+
+        results = executor.execute_tool_batch(calls)
+        assert results == [executor.execute_tool(name, args) for name, args in calls]
+
+    @pytest.fixture
+    def backend_executor(self, monkeypatch):
+        """An executor on the extension path, backed by a stand-in class."""
+        from fast_crewai import tools
+
+        class FakeExecutor:
+            def __init__(self, max_recursion_depth):
+                self.batches = []
+                self.error = None
+
+            def execute_tool_batch(self, calls):
+                if self.error is not None:
+                    raise self.error
+                self.batches.append(calls)
+                return [f"Executed {name} with args: {args}" for name, args in calls]
+
+        monkeypatch.setattr(tools, "_RUST_AVAILABLE", True)
+        monkeypatch.setattr(tools, "_RustToolExecutor", FakeExecutor, raising=False)
+        executor = tools.AcceleratedToolExecutor()
+        assert executor.implementation == "rust"
+        return executor
+
+    def test_tool_batch_crosses_backend_once(self, backend_executor):
+        """Test that a batch goes to the backend in a single call."""
+        results = backend_executor.execute_tool_batch([("calculator", {"a": 1}), ("search", "query")])
+
+        assert backend_executor._executor.batches == [
+            [("calculator", '{"a": 1}'), ("search", "query")]
+        ]
+        assert results == [
+            'Executed calculator with args: {"a": 1}',
+            "Executed search with args: query",
+        ]
+
+    def test_tool_batch_recursion_limit(self, backend_executor):
+        """Test that the backend's recursion limit surfaces as RecursionError."""
+        backend_executor._executor.error = RuntimeError("Maximum recursion depth exceeded")
+
+        with pytest.raises(RecursionError):
+            backend_executor.execute_tool_batch([("calculator", {})])
+
+    def test_tool_batch_error_falls_back_once(self, backend_executor):
+        """Test that a backend failure only moves that batch to Python."""
+        backend_executor._executor.error = ValueError("bad batch")
+        assert len(backend_executor.execute_tool_batch([("calculator", {})])) == 1
+
+        backend_executor._executor.error = None
+        backend_executor.execute_tool_batch([("calculator", {})])
+        assert backend_executor._executor.batches == [[("calculator", "{}")]]
+
     def test_tool_concurrent_usage(self):
         """Test that tool executor can be used concurrently."""
         from fast_crewai import RustToolExecutor